@@ -32,6 +32,8 @@ a = Analysis(
         'access_irc.config_manager',
         'access_irc.sound_manager',
         'access_irc.irc_manager',
+        'access_irc.batching_send_queue',
+        'access_irc.rate_limit',
         'access_irc.log_manager',
         'access_irc.dcc_manager',
         'access_irc.plugin_manager',
@@ -25,6 +25,8 @@ from .plugin_manager import PluginManager
 class AccessIRCApplication:
     """Main application class"""
 
+    PLUGIN_LOAD_TIMEOUT = 10  # Seconds auto-connect waits for plugins to load
+
     def __init__(self):
         """Initialize application"""
 
@@ -93,6 +95,9 @@ class AccessIRCApplication:
         # Track recently displayed topics to avoid duplicate join output
         self._recent_topics = {}  # (server, channel) -> (topic, timestamp)
 
+        # Set once auto-connect is scheduled, by plugin loading or its timeout
+        self._auto_connect_started = False
+
     def run(self) -> int:
         """
         Run the application
@@ -103,24 +108,55 @@ class AccessIRCApplication:
         self.window.show_all()
         self.window.update_status("Ready")
 
-        # Load plugins
-        num_plugins = self.plugins.discover_and_load_plugins()
+        # Load plugins off the main thread; startup hooks and auto-connect
+        # follow once they are registered. A plugin that hangs while
+        # importing only delays auto-connect up to PLUGIN_LOAD_TIMEOUT.
+        self.plugins.discover_and_load_plugins_async(self._on_plugins_loaded)
+        GLib.timeout_add_seconds(self.PLUGIN_LOAD_TIMEOUT, self._on_plugin_load_timeout)
+
+        # Show sound loading errors if any
+        if self.sound_load_failures:
+            GLib.idle_add(self._show_sound_load_errors)
+
+        Gtk.main()
+        return 0
+
+    def _on_plugins_loaded(self, num_plugins: int) -> None:
+        """
+        Finish startup once plugins are loaded (runs on the main thread)
+
+        Args:
+            num_plugins: Number of plugins loaded
+        """
         if num_plugins > 0:
             self.window.update_status(f"Loaded {num_plugins} plugin(s)")
 
         # Call plugin startup hooks
         self.plugins.call_startup()
 
-        # Show sound loading errors if any
-        if self.sound_load_failures:
-            GLib.idle_add(self._show_sound_load_errors)
+        self._start_auto_connect()
+
+    def _on_plugin_load_timeout(self) -> bool:
+        """
+        Auto-connect without waiting any longer for plugins to load
+
+        Returns:
+            False (to remove the timeout source)
+        """
+        if not self._auto_connect_started:
+            print("Plugins are still loading; auto-connecting without waiting for them")
+            self._start_auto_connect()
+        return False
+
+    def _start_auto_connect(self) -> None:
+        """Schedule auto-connect, once, whichever of plugin loading and its timeout finishes first"""
+        if self._auto_connect_started:
+            return
+        self._auto_connect_started = True
 
         # Auto-connect to servers after main loop starts (using idle_add to avoid race conditions)
         GLib.idle_add(self._auto_connect_servers)
 
-        Gtk.main()
-        return 0
-
     def _auto_connect_servers(self) -> bool:
         """
         Auto-connect to servers marked for auto-connect
@@ -442,9 +478,9 @@ class AccessIRCApplication:
         for channel in channels:
             self.window.add_system_message(server, channel, message)
 
-            # Log quit if enabled for this server
-            if self._should_log_server(server):
-                self.log.log_quit(server, channel, nick, reason)
+        # Log quit if enabled for this server
+        if self._should_log_server(server):
+            self.log.log_quit_multi(server, channels, nick, reason)
 
         # Update users list if we're viewing a channel on this server
         if self.window.current_server == server and self.window.current_target:
@@ -484,13 +520,13 @@ class AccessIRCApplication:
                 self.window.announce_to_screen_reader(own_message)
 
             # Add to all channels where this user is present (for own nick and others)
-            for channel in connection.channel_users:
-                if new_nick in connection.channel_users[channel]:
-                    self.window.add_system_message(server, channel, message)
+            nick_channels = connection.channels_for_user(new_nick)
+            for channel in nick_channels:
+                self.window.add_system_message(server, channel, message)
 
-                    # Log nick change if enabled for this server
-                    if self._should_log_server(server):
-                        self.log.log_nick(server, channel, old_nick, new_nick)
+            # Log nick change if enabled for this server
+            if self._should_log_server(server):
+                self.log.log_nick_multi(server, nick_channels, old_nick, new_nick)
 
         # Update users list if we're viewing a channel on this server
         if self.window.current_server == server and self.window.current_target:
@@ -501,11 +537,7 @@ class AccessIRCApplication:
 
         # Announce if "all messages" mode is active for any affected channel
         if not is_own_nick and connection:
-            affected_channels = [
-                ch for ch in connection.channel_users
-                if new_nick in connection.channel_users[ch]
-            ]
-            if any(self.window.should_announce_all_messages(server, ch) for ch in affected_channels):
+            if any(self.window.should_announce_all_messages(server, ch) for ch in nick_channels):
                 self.window.announce_to_screen_reader(message)
 
     def on_irc_names(self, server: str, channel: str, users: list) -> None:
@@ -837,6 +869,9 @@ class AccessIRCApplication:
         # Cleanup sound
         self.sound.cleanup()
 
+        # Flush buffered log lines and close log files
+        self.log.cleanup()
+
         Gtk.main_quit()
 
 
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Batching Send Queue for Access IRC
+Coalesces outgoing IRC lines into batched writes
+"""
+
+import threading
+from collections import deque
+from typing import Callable, List, Optional
+
+
+class BatchingSendQueue:
+    """
+    Queue of outgoing IRC lines that is drained in batches
+
+    Producers append lines and call schedule_flush(). The first producer to
+    find no flush in progress becomes the flusher and keeps draining until
+    the queue is empty, picking up lines other threads appended while it was
+    writing. Other producers wait for that flush to finish, which includes
+    their lines, so every caller learns whether its lines were written.
+    There is no timer and no batching window: a lone sender is flushed
+    straight away, and concurrent senders pile up behind the active flush.
+
+    Control lines (JOIN, PART, CTCP) can be queued on a priority lane,
+    which is always drained ahead of bulk chat traffic so they are not
+    stuck behind a long paste.
+
+    Each batch is capped in lines and bytes, so a large backlog is written
+    as a series of modest writes instead of one that overruns the socket's
+    send buffer.
+    """
+
+    MAX_BATCH_LINES = 32
+    MAX_BATCH_BYTES = 8192  # Default; counted as line length + CRLF
+
+    def __init__(self, write_lines: Callable[[List[str]], Optional[bool]]):
+        """
+        Initialize send queue
+
+        Args:
+            write_lines: Function that writes a batch of lines (without CRLF)
+                and returns False if the batch could not be written
+        """
+        self._write_lines = write_lines
+        self.max_batch_bytes = self.MAX_BATCH_BYTES
+        self._priority: deque = deque()
+        self._pending: deque = deque()
+        self._lock = threading.Lock()
+        self._drained = threading.Condition(self._lock)
+        self._flushing = False
+        self._flusher: Optional[int] = None  # Thread ident of the active flusher
+        self._flushes = 0  # Completed flushes, so waiters can tell theirs ended
+        self._failures = 0  # Batches that failed to write
+
+    def append(self, line: str, priority: bool = False) -> None:
+        """
+        Queue a line for sending
+
+        Args:
+            line: Raw IRC line without trailing CRLF
+            priority: Send ahead of any queued bulk lines
+        """
+        if priority:
+            self._priority.append(line)
+        else:
+            self._pending.append(line)
+
+    def extend(self, lines: List[str]) -> None:
+        """
+        Queue several lines for sending, preserving their order
+
+        Args:
+            lines: Raw IRC lines without trailing CRLF
+        """
+        self._pending.extend(lines)
+
+    def schedule_flush(self) -> bool:
+        """
+        Flush queued lines, or wait for the flush already in progress
+
+        Returns:
+            False if a batch failed to write while the caller's lines were
+            queued (they may not have been sent), True otherwise
+        """
+        with self._lock:
+            failures = self._failures
+            if self._flushing:
+                if self._flusher == threading.get_ident():
+                    # Queued from inside write_lines; this flush picks it up
+                    return True
+                flushes = self._flushes
+                while self._flushes == flushes:
+                    self._drained.wait()
+                return self._failures == failures
+            self._flushing = True
+            self._flusher = threading.get_ident()
+
+        try:
+            while True:
+                with self._lock:
+                    if not self._priority and not self._pending:
+                        self._finish_flush()
+                        return self._failures == failures
+                    batch = self._take_batch()
+                if self._write_lines(batch) is False:
+                    with self._lock:
+                        self._failures += 1
+        except BaseException:
+            with self._lock:
+                self._failures += 1
+                self._finish_flush()
+            raise
+
+    def _finish_flush(self) -> None:
+        """Mark the flush done and wake waiting producers. Caller holds the lock."""
+        self._flushing = False
+        self._flusher = None
+        self._flushes += 1
+        self._drained.notify_all()
+
+    def _take_batch(self) -> List[str]:
+        """Pop the next batch of lines, priority lane first. Caller holds the lock."""
+        batch: List[str] = []
+        size = 0
+        for lane in (self._priority, self._pending):
+            while lane and len(batch) < self.MAX_BATCH_LINES:
+                line_size = len(lane[0]) + 2
+                if batch and size + line_size > self.max_batch_bytes:
+                    return batch
+                batch.append(lane.popleft())
+                size += line_size
+        return batch
+
+    def clear(self) -> None:
+        """Drop any lines that have not been written yet."""
+        with self._lock:
+            self._priority.clear()
+            self._pending.clear()
+
+    def __len__(self) -> int:
+        return len(self._priority) + len(self._pending)
@@ -11,6 +11,7 @@ from gi.repository import Gtk, Gdk, GLib, Pango
 
 from typing import Optional, Dict, Tuple
 from datetime import datetime
+import os
 import subprocess
 import locale
 import types
@@ -58,8 +59,13 @@ class AccessibleIRCWindow(Gtk.Window):
         self.irc_manager = None
         self.sound_manager = None
         self.config_manager = None
+        self.log_manager = None
         self.plugin_manager = None
 
+        # GTK skips loading the AT-SPI bridge when NO_AT_BRIDGE=1, and then
+        # no screen reader can receive announcements
+        self.has_screen_reader = os.environ.get("NO_AT_BRIDGE") != "1"
+
         # Current context
         self.current_server: Optional[str] = None
         self.current_target: Optional[str] = None  # Channel or PM recipient
@@ -501,6 +507,9 @@ class AccessibleIRCWindow(Gtk.Window):
         Args:
             message: Message to announce
         """
+        if not self.has_screen_reader:
+            return
+
         try:
             # Get accessible object from main window
             atk_object = self.get_accessible()
@@ -2073,19 +2082,20 @@ class AccessibleIRCWindow(Gtk.Window):
                 # Send output to current channel/PM as messages
                 if self.current_target and self.irc_manager:
                     any_sent = False
-                    for line in lines:
-                        if line:  # Skip empty lines
-                            sent_chunks = self.irc_manager.send_message(
-                                self.current_server, self.current_target, line
-                            )
-                            if sent_chunks:
-                                any_sent = True
-                            # Show in our own view
-                            connection = self.irc_manager.connections.get(self.current_server)
-                            our_nick = connection.nickname if connection else "You"
-                            for chunk in sent_chunks:
-                                self.add_message(self.current_server, self.current_target,
-                                               our_nick, chunk)
+                    with self.irc_manager.burst(self.current_server):
+                        for line in lines:
+                            if line:  # Skip empty lines
+                                sent_chunks = self.irc_manager.send_message(
+                                    self.current_server, self.current_target, line
+                                )
+                                if sent_chunks:
+                                    any_sent = True
+                                # Show in our own view
+                                connection = self.irc_manager.connections.get(self.current_server)
+                                our_nick = connection.nickname if connection else "You"
+                                for chunk in sent_chunks:
+                                    self.add_message(self.current_server, self.current_target,
+                                                   our_nick, chunk)
                     # Play sound once after all lines sent
                     if self.sound_manager and any_sent:
                         if not self.current_target.startswith("#"):
@@ -2589,6 +2599,10 @@ class AccessibleIRCWindow(Gtk.Window):
         if self.sound_manager:
             self.sound_manager.cleanup()
 
+        # Flush buffered log lines and close log files
+        if self.log_manager:
+            self.log_manager.cleanup()
+
         Gtk.main_quit()
 
     def show_channel_list_dialog(self, server: str, channels: list) -> None:
@@ -6,10 +6,15 @@ Handles multiple IRC server connections using miniirc
 
 import re
 import ssl
+import sys
 import socket
 import threading
+from bisect import bisect_left, insort
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Dict, Callable, Optional, List, Any
+from typing import Dict, Callable, Optional, List, Any, Tuple, Iterator, Sequence
 from gi.repository import GLib
 
 try:
@@ -19,6 +24,37 @@ except ImportError:
     MINIIRC_AVAILABLE = False
     print("Warning: miniirc not available. Please install with: pip install miniirc")
 
+from .batching_send_queue import BatchingSendQueue
+from .rate_limit import print_rate_limited
+
+
+# ASCII whitespace skipped between message chunks (same set as bytes.lstrip)
+_LEADING_WHITESPACE_RE = re.compile(rb'[ \t\n\r\x0b\x0c]*')
+
+# Auto-connect slash commands that map directly onto a raw IRC command
+_AUTO_COMMAND_QUOTES = {
+    "nick": "NICK {args}",
+    "mode": "MODE {args}",
+    "join": "JOIN {args}",
+    "part": "PART {args}",
+    "leave": "PART {args}",
+    "whois": "WHOIS {args}",
+}
+# RFC 1459 case mapping: [, ], \ and ~ are the uppercase forms of {, }, | and ^
+_IRC_CASEFOLD_TABLE = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ[]\\~",
+    "abcdefghijklmnopqrstuvwxyz{}|^"
+)
+
+# Shared result for lookups and sends that found nothing, so miss paths
+# don't allocate a fresh empty list each time
+_EMPTY: Tuple[str, ...] = ()
+
+# Connection whose event callback is currently running (see IRCManager.reply)
+_current_connection: ContextVar[Optional["IRCConnection"]] = ContextVar(
+    "access_irc_current_connection", default=None
+)
+
 
 def strip_irc_formatting(text: str) -> str:
     """
@@ -56,6 +92,26 @@ def strip_irc_formatting(text: str) -> str:
 class IRCConnection:
     """Represents a single IRC server connection"""
 
+    # Fixed attribute layout: no per-instance __dict__, and the attributes
+    # handlers touch on every event are read from slots
+    __slots__ = (
+        # Configuration
+        "server_name", "host", "port", "ssl", "verify_ssl", "channels",
+        "_nickname", "_nick_lower", "_nick_folded", "base_nickname",
+        "alternate_nicks", "_alternate_nick_index", "realname",
+        "username", "password", "use_sasl", "auto_connect_commands",
+        # Event dispatch
+        "callbacks", "_dispatch_queue", "_dispatch_lock", "_idle_scheduled",
+        # Connection and sending
+        "irc", "connected", "cancelled", "on_connected_change", "send_queue",
+        "_burst_depth",
+        # Channel and user tracking
+        "_channel_set", "current_channels", "channel_users", "_sorted_users",
+        "_user_channels", "_user_snapshots", "_users_lock",
+        "channel_list", "channel_list_in_progress",
+        "_max_length_cache",
+    )
+
     # Prefix and mode handling for user list updates
     USER_MODE_PREFIXES = {
         "q": "~",
@@ -65,14 +121,34 @@ class IRCConnection:
         "v": "+",
     }
     PREFIX_RANK = {"~": 5, "&": 4, "@": 3, "%": 2, "+": 1}
-    PREFIX_CHARS = set(PREFIX_RANK.keys())
-    MODE_PARAMS_ALWAYS = set("beI") | set(USER_MODE_PREFIXES.keys())
-    MODE_PARAMS_ON_SET = set("klfj")
+    PREFIX_CHARS = frozenset(PREFIX_RANK.keys())
+    MODE_PARAMS_ALWAYS = frozenset("beI") | frozenset(USER_MODE_PREFIXES.keys())
+    MODE_PARAMS_ON_SET = frozenset("klfj")
+
+    # Tokenizes a MODE string into sign changes (group 1) and mode letters (group 2)
+    _MODE_TOKEN_RE = re.compile(r'([+-])|([A-Za-z])')
+
+    # Separators accepted between alternate nicknames
+    _NICK_SPLIT_RE = re.compile(r"[,\n]+")
+
+    # ERR_ERRONEUSNICKNAME, ERR_NICKNAMEINUSE, ERR_NICKCOLLISION, ERR_UNAVAILRESOURCE
+    _NICK_ERROR_CODES = ("432", "433", "436", "437")
 
     # IRC protocol limit is 512 bytes per message including CRLF
     # Reserve space for: hostmask prefix (~100), PRIVMSG command (8), target, colon-space (2), CRLF (2)
     IRC_MAX_LINE = 512
     IRC_HOSTMASK_BUFFER = 100  # Conservative estimate for :nick!user@host prefix
+    MAX_LENGTH_CACHE_SIZE = 256  # Targets remembered by _calculate_max_message_length
+    # Targets per PRIVMSG in send_message_multi (we do not parse TARGMAX, so
+    # stay within the common ircd default)
+    MAX_MESSAGE_TARGETS = 4
+    # Upper bound for one batched socket write, whatever the send buffer size
+    MAX_SEND_BATCH_BYTES = 32768
+
+    # CTCP framing: \x01ACTION text\x01
+    _CTCP_DELIM = "\x01"
+    _CTCP_ACTION_PREFIX = "\x01ACTION "
+    _CTCP_ACTION_OVERHEAD = len(_CTCP_ACTION_PREFIX) + len(_CTCP_DELIM)
 
     def __init__(self, server_config: Dict[str, Any], callbacks: Dict[str, Callable]):
         """
@@ -82,7 +158,8 @@ class IRCConnection:
             server_config: Server configuration dict
             callbacks: Dict of callback functions (on_message, on_join, on_part, on_connect, on_disconnect)
         """
-        self.server_name = server_config.get("name", "Unknown")
+        # Interned since it is passed with every dispatched event
+        self.server_name = sys.intern(str(server_config.get("name", "Unknown")))
         self.host = server_config.get("host")
         self.port = server_config.get("port", 6667)
         self.ssl = server_config.get("ssl", False)
@@ -105,31 +182,92 @@ class IRCConnection:
         )
 
         self.callbacks = callbacks
+        # Events waiting for the GTK main thread, drained by one idle source
+        self._dispatch_queue: deque = deque()
+        self._dispatch_lock = threading.Lock()
+        self._idle_scheduled = False
         self.irc: Optional[miniirc.IRC] = None
         self.connected = False
-        self.current_channels: List[str] = []
+        # Set by IRCManager.disconnect_server; a connect still in progress
+        # on the background thread drops the session when it sees this
+        self.cancelled = False
+        # Optional hook called as (server_name, connected) on state changes
+        self.on_connected_change: Optional[Callable[[str, bool], None]] = None
+        # Outgoing PRIVMSG lines, coalesced into batched writes
+        self.send_queue = BatchingSendQueue(self._write_lines)
+        self._burst_depth = 0  # Nesting level of burst() blocks
+        # Channels we are in: a set for membership tests plus an immutable
+        # tuple that is rebuilt on change and can be handed out as-is
+        self._channel_set: set = set()
+        self.current_channels: Tuple[str, ...] = ()
 
         # Track users in each channel: Dict[channel, Set[nickname]]
         self.channel_users: Dict[str, set] = {}
+        # Sorted user lists built on first request, then kept sorted in place
+        self._sorted_users: Dict[str, List[str]] = {}
+        # Reverse index: Dict[nickname without prefix, Set[channel]]
+        self._user_channels: Dict[str, set] = {}
+        # Immutable copies of the sorted lists handed out by get_channel_users
+        self._user_snapshots: Dict[str, Tuple[str, ...]] = {}
+        # Guards all of the user tracking above: it is updated on the miniirc
+        # thread and read from the GTK main thread
+        self._users_lock = threading.RLock()
 
         # Channel list storage for /list command
         self.channel_list: List[Dict[str, Any]] = []
         self.channel_list_in_progress = False
 
-    def _call_callback(self, callback_name: str, *args) -> bool:
+        # Per-target message length limits: Dict[(target, extra_overhead), max_length]
+        self._max_length_cache: Dict[Tuple[str, int], int] = {}
+
+    def _enqueue_dispatch(self, callback_name: str, *args) -> None:
         """
-        Helper to call a callback and ensure it returns False for GLib.idle_add
+        Schedule a callback to run on the GTK main thread
+
+        This is the only place IRC events are handed to GLib. Events are
+        queued and at most one idle source is registered per connection at a
+        time; it delivers everything queued so far in one main loop
+        iteration, so a NAMES flood or netsplit costs one wakeup rather than
+        one per event. The source is one-shot, so an idle connection costs
+        no CPU.
 
         Args:
             callback_name: Name of callback in self.callbacks dict
             *args: Arguments to pass to callback
+        """
+        # Resolve the callback now so delivery is a direct call, and so
+        # events nobody listens for never wake the main loop
+        callback = self.callbacks.get(callback_name)
+        if not callback:
+            return
+        with self._dispatch_lock:
+            self._dispatch_queue.append((callback_name, callback, args))
+            if self._idle_scheduled:
+                return
+            self._idle_scheduled = True
+        GLib.idle_add(self._drain_dispatch_queue)
+
+    def _drain_dispatch_queue(self) -> bool:
+        """
+        Deliver all queued events (runs on the GTK main thread)
 
         Returns:
-            False (to prevent callback from being called again)
+            False (to remove the idle source)
         """
-        callback = self.callbacks.get(callback_name)
-        if callback:
-            callback(*args)
+        with self._dispatch_lock:
+            pending = self._dispatch_queue
+            self._dispatch_queue = deque()
+            self._idle_scheduled = False
+
+        token = _current_connection.set(self)
+        try:
+            for callback_name, callback, args in pending:
+                try:
+                    callback(*args)
+                except Exception as e:
+                    print(f"Error in {callback_name} callback: {e}")
+        finally:
+            _current_connection.reset(token)
         return False
 
     def _report_server_message(self, message: str) -> None:
@@ -138,8 +276,7 @@ class IRCConnection:
             return
         callback = self.callbacks.get("on_server_message")
         if callback:
-            GLib.idle_add(
-                self._call_callback,
+            self._enqueue_dispatch(
                 "on_server_message",
                 self.server_name,
                 message
@@ -263,8 +400,7 @@ class IRCConnection:
         """
         callback = self.callbacks.get("on_connection_error")
         if callback:
-            GLib.idle_add(
-                self._call_callback,
+            self._enqueue_dispatch(
                 "on_connection_error",
                 self.server_name,
                 error_message,
@@ -278,9 +414,11 @@ class IRCConnection:
             """Handle successful connection"""
             if args:
                 self.nickname = args[0]
-            self.connected = True
+            # miniirc opens a new socket on every (re)connect
+            self._tune_socket()
+            self._set_connected(True)
             self._run_auto_connect_commands()
-            GLib.idle_add(self._call_callback, "on_connect", self.server_name)
+            self._enqueue_dispatch("on_connect", self.server_name)
 
         def on_message(irc, hostmask, args):
             """Handle incoming messages"""
@@ -290,37 +428,23 @@ class IRCConnection:
             message = args[-1]
 
             # Check if it's a private message or channel message
-            is_private = target == self.nickname
+            is_private = self._is_own_nick(target)
             # For PMs, use the sender's nickname as the target so we can track conversations
             channel = sender if is_private else target
 
             # Check for CTCP messages (start and end with \x01)
             if message.startswith('\x01') and message.endswith('\x01'):
-                ctcp_content = message[1:-1]  # Remove \x01 wrappers
-
-                # Check for DCC
-                if ctcp_content.upper().startswith("DCC "):
-                    # Route to DCC handler
-                    GLib.idle_add(
-                        self._call_callback,
-                        "on_ctcp_dcc",
-                        self.server_name,
-                        sender,
-                        ctcp_content
-                    )
-                    return  # Don't process as regular message
-
-                # Check for CTCP ACTION (/me)
-                if ctcp_content.startswith('ACTION '):
-                    # Extract action text
-                    action = ctcp_content[7:]  # Remove 'ACTION '
+                # Check for CTCP ACTION (/me), by far the most common CTCP,
+                # straight on the raw message so only one slice is taken
+                if message.startswith(self._CTCP_ACTION_PREFIX):
+                    # Extract action text without the \x01ACTION and \x01 wrappers
+                    action = message[len(self._CTCP_ACTION_PREFIX):-1]
                     # Strip IRC formatting codes from action
                     clean_action = strip_irc_formatting(action)
                     # Check if nickname is mentioned in the action (check both original and clean)
-                    is_mention = self.nickname.lower() in action.lower() or self.nickname.lower() in clean_action.lower()
+                    is_mention = self._mentions_nick(action, clean_action)
                     # Call on_action callback
-                    GLib.idle_add(
-                        self._call_callback,
+                    self._enqueue_dispatch(
                         "on_action",
                         self.server_name,
                         channel,
@@ -331,17 +455,27 @@ class IRCConnection:
                     )
                     return  # Don't process as regular message
 
+                # Check for DCC (case-insensitive, without uppercasing the whole payload)
+                if message[1:5].upper() == "DCC ":
+                    # Route to DCC handler
+                    self._enqueue_dispatch(
+                        "on_ctcp_dcc",
+                        self.server_name,
+                        sender,
+                        message[1:-1]  # Remove \x01 wrappers
+                    )
+                    return  # Don't process as regular message
+
             # Regular message (not CTCP)
             else:
                 # Regular message
                 # Strip IRC formatting codes from message
                 clean_message = strip_irc_formatting(message)
                 # Check if nickname is mentioned (check both original and clean for safety)
-                is_mention = self.nickname.lower() in message.lower() or self.nickname.lower() in clean_message.lower()
+                is_mention = self._mentions_nick(message, clean_message)
 
-                # Use GLib.idle_add to call callback in GTK main thread
-                GLib.idle_add(
-                    self._call_callback,
+                # Dispatch callback on the GTK main thread
+                self._enqueue_dispatch(
                     "on_message",
                     self.server_name,
                     channel,
@@ -353,12 +487,11 @@ class IRCConnection:
 
         def on_join(irc, hostmask, args):
             """Handle user join"""
-            nick = hostmask[0] if hostmask else "Unknown"
-            channel = args[0]
+            nick = sys.intern(hostmask[0]) if hostmask else "Unknown"
+            channel = sys.intern(args[0])
 
             # Track our own channel joins
-            if nick == self.nickname and channel not in self.current_channels:
-                self.current_channels.append(channel)
+            if self._is_own_nick(nick) and self._add_current_channel(channel):
                 # Request topic explicitly (some bouncers don't send it on join)
                 if self.irc:
                     try:
@@ -369,8 +502,7 @@ class IRCConnection:
             # Add user to channel user list
             self.add_user_to_channel(channel, nick)
 
-            GLib.idle_add(
-                self._call_callback,
+            self._enqueue_dispatch(
                 "on_join",
                 self.server_name,
                 channel,
@@ -384,16 +516,14 @@ class IRCConnection:
             reason = args[1] if len(args) > 1 else ""
 
             # Track our own channel parts
-            if nick == self.nickname and channel in self.current_channels:
-                self.current_channels.remove(channel)
+            if self._is_own_nick(nick) and self._remove_current_channel(channel):
                 # Clear the entire user list for this channel when we leave
                 self.clear_channel_users(channel)
             else:
                 # Remove user from channel user list
                 self.remove_user_from_channel(channel, nick)
 
-            GLib.idle_add(
-                self._call_callback,
+            self._enqueue_dispatch(
                 "on_part",
                 self.server_name,
                 channel,
@@ -406,17 +536,10 @@ class IRCConnection:
             nick = hostmask[0] if hostmask else "Unknown"
             reason = args[0] if args else ""
 
-            # Capture which channels the user was in BEFORE removing them
-            affected_channels = []
-            for channel in self.channel_users:
-                if nick in self.channel_users[channel]:
-                    affected_channels.append(channel)
+            # Remove user from all channels, noting which ones they were in
+            affected_channels = self.remove_user_from_all_channels(nick)
 
-            # Remove user from all channels
-            self.remove_user_from_all_channels(nick)
-
-            GLib.idle_add(
-                self._call_callback,
+            self._enqueue_dispatch(
                 "on_quit",
                 self.server_name,
                 nick,
@@ -427,17 +550,16 @@ class IRCConnection:
         def on_nick(irc, hostmask, args):
             """Handle nick change"""
             old_nick = hostmask[0] if hostmask else "Unknown"
-            new_nick = args[0]
+            new_nick = sys.intern(args[0])
 
             # Track our own nick changes
-            if old_nick == self.nickname:
+            if self._is_own_nick(old_nick):
                 self.nickname = new_nick
 
             # Rename user in all channels
             self.rename_user(old_nick, new_nick)
 
-            GLib.idle_add(
-                self._call_callback,
+            self._enqueue_dispatch(
                 "on_nick",
                 self.server_name,
                 old_nick,
@@ -449,23 +571,13 @@ class IRCConnection:
             # args format: [nickname, channel_type, channel, names_list]
             # Example: ['yournick', '=', '#channel', 'user1 user2 @user3 +user4']
             if len(args) >= 4:
-                channel = args[2]
+                channel = sys.intern(args[2])
                 names_str = args[3]
 
-                # Parse names and keep mode prefixes (@, +, %, ~, &) to show permissions
-                for name in names_str.split():
-                    self.add_user_to_channel(channel, name)
-
-                users = self.get_channel_users(channel)
-
-                # Notify GUI of user list update
-                GLib.idle_add(
-                    self._call_callback,
-                    "on_names",
-                    self.server_name,
-                    channel,
-                    users
-                )
+                # Parse names and keep mode prefixes (@, +, %, ~, &) to show permissions.
+                # Large channels span several 353 lines; the GUI is told once,
+                # when the 366 end-of-names arrives.
+                self.add_users_to_channel(channel, names_str.split())
 
         def on_kick(irc, hostmask, args):
             """Handle user kick"""
@@ -479,12 +591,10 @@ class IRCConnection:
             self.remove_user_from_channel(channel, kicked_nick)
 
             # If we were kicked, clear the channel
-            if kicked_nick == self.nickname and channel in self.current_channels:
-                self.current_channels.remove(channel)
+            if self._is_own_nick(kicked_nick) and self._remove_current_channel(channel):
                 self.clear_channel_users(channel)
 
-            GLib.idle_add(
-                self._call_callback,
+            self._enqueue_dispatch(
                 "on_kick",
                 self.server_name,
                 channel,
@@ -497,13 +607,11 @@ class IRCConnection:
             """Handle end of NAMES list (366) - indicates we're in a channel"""
             # args format: [nickname, channel, "End of /NAMES list"]
             if len(args) >= 2:
-                channel = args[1]
+                channel = sys.intern(args[1])
                 # Check if this channel is already in our list
-                if channel not in self.current_channels:
-                    self.current_channels.append(channel)
+                if self._add_current_channel(channel):
                     # Trigger a join event to add to tree
-                    GLib.idle_add(
-                        self._call_callback,
+                    self._enqueue_dispatch(
                         "on_join",
                         self.server_name,
                         channel,
@@ -516,6 +624,15 @@ class IRCConnection:
                         except Exception as e:
                             print(f"Failed to request topic for {channel}: {e}")
 
+                # Notify GUI of the complete user list
+                if channel in self.channel_users:
+                    self._enqueue_dispatch(
+                        "on_names",
+                        self.server_name,
+                        channel,
+                        self.get_channel_users(channel)
+                    )
+
         def on_notice(irc, hostmask, args):
             """Handle NOTICE messages"""
             # hostmask format: nick!user@host or server name
@@ -524,7 +641,7 @@ class IRCConnection:
             message = args[-1]
 
             # Check if it's a private notice or channel notice
-            is_private = target == self.nickname
+            is_private = self._is_own_nick(target)
             # For private notices, use the server name as the target (routes to server buffer)
             # This prevents opening PM windows for every notice
             channel = self.server_name if is_private else target
@@ -532,9 +649,8 @@ class IRCConnection:
             # Strip IRC formatting codes from notice message
             clean_message = strip_irc_formatting(message)
 
-            # Use GLib.idle_add to call callback in GTK main thread
-            GLib.idle_add(
-                self._call_callback,
+            # Dispatch callback on the GTK main thread
+            self._enqueue_dispatch(
                 "on_notice",
                 self.server_name,
                 channel,
@@ -551,8 +667,7 @@ class IRCConnection:
                 host = args[3]
                 realname = args[5]
                 message = f"WHOIS {nick}: {realname} ({username}@{host})"
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_server_message",
                     self.server_name,
                     message
@@ -566,8 +681,7 @@ class IRCConnection:
                 server = args[2]
                 server_info = args[3]
                 message = f"WHOIS {nick}: connected to {server} ({server_info})"
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_server_message",
                     self.server_name,
                     message
@@ -579,8 +693,7 @@ class IRCConnection:
             if len(args) >= 2:
                 nick = args[1]
                 message = f"WHOIS {nick}: is an IRC operator"
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_server_message",
                     self.server_name,
                     message
@@ -591,19 +704,7 @@ class IRCConnection:
             # args format: [our_nick, target_nick, idle_seconds, signon_time, :message]
             if len(args) >= 3:
                 nick = args[1]
-                idle_seconds = int(args[2])
-                idle_minutes = idle_seconds // 60
-                idle_hours = idle_minutes // 60
-                idle_days = idle_hours // 24
-
-                if idle_days > 0:
-                    idle_str = f"{idle_days}d {idle_hours % 24}h"
-                elif idle_hours > 0:
-                    idle_str = f"{idle_hours}h {idle_minutes % 60}m"
-                elif idle_minutes > 0:
-                    idle_str = f"{idle_minutes}m"
-                else:
-                    idle_str = f"{idle_seconds}s"
+                idle_str = self._format_idle(int(args[2]))
 
                 message = f"WHOIS {nick}: idle {idle_str}"
                 if len(args) >= 4:
@@ -612,8 +713,7 @@ class IRCConnection:
                     signon_date = datetime.fromtimestamp(signon_timestamp).strftime("%Y-%m-%d %H:%M:%S")
                     message += f", signed on at {signon_date}"
 
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_server_message",
                     self.server_name,
                     message
@@ -626,8 +726,7 @@ class IRCConnection:
                 nick = args[1]
                 channels = args[2]
                 message = f"WHOIS {nick}: in channels {channels}"
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_server_message",
                     self.server_name,
                     message
@@ -640,8 +739,7 @@ class IRCConnection:
                 nick = args[1]
                 account = args[2]
                 message = f"WHOIS {nick}: logged in as {account}"
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_server_message",
                     self.server_name,
                     message
@@ -653,8 +751,7 @@ class IRCConnection:
             if len(args) >= 2:
                 nick = args[1]
                 message = f"WHOIS {nick}: using a secure connection (SSL/TLS)"
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_server_message",
                     self.server_name,
                     message
@@ -666,8 +763,7 @@ class IRCConnection:
             if len(args) >= 2:
                 nick = args[1]
                 message = f"End of WHOIS for {nick}"
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_server_message",
                     self.server_name,
                     message
@@ -695,8 +791,7 @@ class IRCConnection:
         def on_list_end(irc, hostmask, args):
             """Handle end of channel list (323 RPL_LISTEND)"""
             self.channel_list_in_progress = False
-            GLib.idle_add(
-                self._call_callback,
+            self._enqueue_dispatch(
                 "on_channel_list_ready",
                 self.server_name,
                 self.channel_list.copy()
@@ -709,8 +804,7 @@ class IRCConnection:
                 channel = args[1]
                 reason = args[2] if len(args) >= 3 else "Cannot join channel"
                 message = f"Cannot join {channel}: {reason}"
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_server_message",
                     self.server_name,
                     message
@@ -723,8 +817,7 @@ class IRCConnection:
             if len(args) >= 2:
                 inviter = hostmask[0] if hostmask else "Someone"
                 channel = args[1]
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_invite",
                     self.server_name,
                     inviter,
@@ -739,8 +832,7 @@ class IRCConnection:
                 topic = args[1] if len(args) >= 2 else ""
                 clean_topic = strip_irc_formatting(topic)
                 setter = hostmask[0] if hostmask else "Server"
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_topic_change",
                     self.server_name,
                     channel,
@@ -755,8 +847,7 @@ class IRCConnection:
                 channel = args[1]
                 topic = args[2]
                 clean_topic = strip_irc_formatting(topic)
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_topic_reply",
                     self.server_name,
                     channel,
@@ -768,8 +859,7 @@ class IRCConnection:
             # args format: [our_nick, channel, :No topic is set]
             if len(args) >= 2:
                 channel = args[1]
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_no_topic",
                     self.server_name,
                     channel
@@ -782,8 +872,7 @@ class IRCConnection:
                 channel = args[1]
                 setter = args[2]
                 timestamp = args[3]
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_topic_setter",
                     self.server_name,
                     channel,
@@ -805,8 +894,7 @@ class IRCConnection:
                 if target and target[0] in ("#", "&", "!", "+"):
                     self._apply_mode_changes(target, mode_str, params)
 
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_mode_change",
                     self.server_name,
                     target,
@@ -820,8 +908,7 @@ class IRCConnection:
             if len(args) >= 3:
                 channel = args[1]
                 modes = " ".join(args[2:])
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_channel_mode",
                     self.server_name,
                     channel,
@@ -833,8 +920,7 @@ class IRCConnection:
             # args format: [our_nick, modes]
             if len(args) >= 2:
                 modes = " ".join(args[1:])
-                GLib.idle_add(
-                    self._call_callback,
+                self._enqueue_dispatch(
                     "on_user_mode",
                     self.server_name,
                     modes
@@ -849,8 +935,7 @@ class IRCConnection:
             else:
                 return
             line = strip_irc_formatting(line)
-            GLib.idle_add(
-                self._call_callback,
+            self._enqueue_dispatch(
                 "on_motd_line",
                 self.server_name,
                 line
@@ -862,60 +947,144 @@ class IRCConnection:
                 self._handle_nick_error(code, args)
             return handler
 
+        # IRC command/numeric -> handler. Replies with identical handling
+        # share one handler function.
+        handlers = (
+            ("001", on_connect),  # RPL_WELCOME
+            ("PRIVMSG", on_message),
+            ("NOTICE", on_notice),
+            ("JOIN", on_join),
+            ("PART", on_part),
+            ("QUIT", on_quit),
+            ("NICK", on_nick),
+            ("353", on_names_reply),  # RPL_NAMREPLY
+            ("366", on_endofnames),  # RPL_ENDOFNAMES
+            ("KICK", on_kick),
+            ("INVITE", on_invite),
+            ("TOPIC", on_topic_change),
+            ("MODE", on_mode_change),
+
+            # WHOIS replies
+            ("311", on_whois_user),  # RPL_WHOISUSER
+            ("312", on_whois_server),  # RPL_WHOISSERVER
+            ("313", on_whois_operator),  # RPL_WHOISOPERATOR
+            ("317", on_whois_idle),  # RPL_WHOISIDLE
+            ("318", on_end_of_whois),  # RPL_ENDOFWHOIS
+            ("319", on_whois_channels),  # RPL_WHOISCHANNELS
+            ("330", on_whois_account),  # RPL_WHOISACCOUNT
+            ("671", on_whois_secure),  # RPL_WHOISSECURE
+
+            # Channel list
+            ("322", on_list_entry),  # RPL_LIST
+            ("323", on_list_end),  # RPL_LISTEND
+
+            # Channel join errors
+            ("471", on_channel_error),  # ERR_CHANNELISFULL
+            ("473", on_channel_error),  # ERR_INVITEONLYCHAN
+            ("474", on_channel_error),  # ERR_BANNEDFROMCHAN
+            ("475", on_channel_error),  # ERR_BADCHANNELKEY
+            ("477", on_channel_error),  # ERR_NEEDREGGEDNICK
+
+            # Topic replies
+            ("331", on_no_topic),  # RPL_NOTOPIC
+            ("332", on_topic_reply),  # RPL_TOPIC
+            ("333", on_topic_setter),  # RPL_TOPICWHOTIME
+
+            # Mode replies
+            ("324", on_channel_mode),  # RPL_CHANNELMODEIS
+            ("221", on_user_mode),  # RPL_UMODEIS
+
+            # MOTD replies
+            ("375", on_motd_line),  # RPL_MOTDSTART
+            ("372", on_motd_line),  # RPL_MOTD
+            ("376", on_motd_line),  # RPL_ENDOFMOTD
+            ("422", on_motd_line),  # ERR_NOMOTD
+        )
+
         # Register handlers with IRC instance
-        self.irc.Handler("001", colon=False)(on_connect)  # RPL_WELCOME
-        self.irc.Handler("PRIVMSG", colon=False)(on_message)
-        self.irc.Handler("NOTICE", colon=False)(on_notice)
-        self.irc.Handler("JOIN", colon=False)(on_join)
-        self.irc.Handler("PART", colon=False)(on_part)
-        self.irc.Handler("QUIT", colon=False)(on_quit)
-        self.irc.Handler("NICK", colon=False)(on_nick)
-        self.irc.Handler("353", colon=False)(on_names_reply)  # RPL_NAMREPLY
-        self.irc.Handler("366", colon=False)(on_endofnames)  # RPL_ENDOFNAMES
-        self.irc.Handler("KICK", colon=False)(on_kick)
-        self.irc.Handler("INVITE", colon=False)(on_invite)
-        self.irc.Handler("TOPIC", colon=False)(on_topic_change)
-        self.irc.Handler("MODE", colon=False)(on_mode_change)
-
-        # WHOIS reply handlers
-        self.irc.Handler("311", colon=False)(on_whois_user)  # RPL_WHOISUSER
-        self.irc.Handler("312", colon=False)(on_whois_server)  # RPL_WHOISSERVER
-        self.irc.Handler("313", colon=False)(on_whois_operator)  # RPL_WHOISOPERATOR
-        self.irc.Handler("317", colon=False)(on_whois_idle)  # RPL_WHOISIDLE
-        self.irc.Handler("318", colon=False)(on_end_of_whois)  # RPL_ENDOFWHOIS
-        self.irc.Handler("319", colon=False)(on_whois_channels)  # RPL_WHOISCHANNELS
-        self.irc.Handler("330", colon=False)(on_whois_account)  # RPL_WHOISACCOUNT
-        self.irc.Handler("671", colon=False)(on_whois_secure)  # RPL_WHOISSECURE
-
-        # Channel list handlers
-        self.irc.Handler("322", colon=False)(on_list_entry)  # RPL_LIST
-        self.irc.Handler("323", colon=False)(on_list_end)  # RPL_LISTEND
-
-        # Channel error handlers
-        self.irc.Handler("471", colon=False)(on_channel_error)  # ERR_CHANNELISFULL
-        self.irc.Handler("473", colon=False)(on_channel_error)  # ERR_INVITEONLYCHAN
-        self.irc.Handler("474", colon=False)(on_channel_error)  # ERR_BANNEDFROMCHAN
-        self.irc.Handler("475", colon=False)(on_channel_error)  # ERR_BADCHANNELKEY
-        self.irc.Handler("477", colon=False)(on_channel_error)  # ERR_NEEDREGGEDNICK
-        self.irc.Handler("432", colon=False)(make_nick_error_handler("432"))  # ERR_ERRONEUSNICKNAME
-        self.irc.Handler("433", colon=False)(make_nick_error_handler("433"))  # ERR_NICKNAMEINUSE
-        self.irc.Handler("436", colon=False)(make_nick_error_handler("436"))  # ERR_NICKCOLLISION
-        self.irc.Handler("437", colon=False)(make_nick_error_handler("437"))  # ERR_UNAVAILRESOURCE
-
-        # Topic replies
-        self.irc.Handler("331", colon=False)(on_no_topic)  # RPL_NOTOPIC
-        self.irc.Handler("332", colon=False)(on_topic_reply)  # RPL_TOPIC
-        self.irc.Handler("333", colon=False)(on_topic_setter)  # RPL_TOPICWHOTIME
-
-        # Mode replies
-        self.irc.Handler("324", colon=False)(on_channel_mode)  # RPL_CHANNELMODEIS
-        self.irc.Handler("221", colon=False)(on_user_mode)  # RPL_UMODEIS
-
-        # MOTD replies
-        self.irc.Handler("375", colon=False)(on_motd_line)  # RPL_MOTDSTART
-        self.irc.Handler("372", colon=False)(on_motd_line)  # RPL_MOTD
-        self.irc.Handler("376", colon=False)(on_motd_line)  # RPL_ENDOFMOTD
-        self.irc.Handler("422", colon=False)(on_motd_line)  # ERR_NOMOTD
+        for code, handler in handlers:
+            self.irc.Handler(code, colon=False)(handler)
+        for code in self._NICK_ERROR_CODES:
+            self.irc.Handler(code, colon=False)(make_nick_error_handler(code))
+
+    @staticmethod
+    def _format_idle(idle_seconds: int) -> str:
+        """
+        Format a WHOIS idle time using its two largest units
+
+        Args:
+            idle_seconds: Idle time in seconds
+
+        Returns:
+            Text like "2d 3h", "4h 5m", "6m" or "7s"
+        """
+        minutes, seconds = divmod(idle_seconds, 60)
+        if not minutes:
+            return f"{seconds}s"
+        hours, minutes = divmod(minutes, 60)
+        if not hours:
+            return f"{minutes}m"
+        days, hours = divmod(hours, 24)
+        if not days:
+            return f"{hours}h {minutes}m"
+        return f"{days}d {hours}h"
+
+    @property
+    def nickname(self) -> str:
+        """Our current nickname on this server."""
+        return self._nickname
+
+    @nickname.setter
+    def nickname(self, nickname: str) -> None:
+        self._nickname = nickname
+        self._nick_lower = nickname.lower()
+        self._nick_folded = nickname.translate(_IRC_CASEFOLD_TABLE)
+
+    def _is_own_nick(self, nick: str) -> bool:
+        """Check whether a nick is ours, using IRC (RFC 1459) case mapping."""
+        return nick == self._nickname or nick.translate(_IRC_CASEFOLD_TABLE) == self._nick_folded
+
+    def _mentions_nick(self, text: str, clean_text: str) -> bool:
+        """
+        Check whether a message mentions our nickname (case-insensitive)
+
+        Args:
+            text: Message as received
+            clean_text: Message with formatting codes stripped
+
+        Returns:
+            True if either form contains our nickname
+        """
+        nick_lower = self._nick_lower
+        if len(text) < len(nick_lower):
+            return False
+        if nick_lower in text.lower():
+            return True
+        # strip_irc_formatting hands back the same object when there was
+        # nothing to strip, in which case there is nothing new to check
+        return clean_text is not text and nick_lower in clean_text.lower()
+
+    def _set_connected(self, connected: bool) -> None:
+        """Update the connected flag and tell anyone watching for changes."""
+        self.connected = connected
+        if self.on_connected_change:
+            self.on_connected_change(self.server_name, connected)
+
+    def _add_current_channel(self, channel: str) -> bool:
+        """Record that we joined a channel. Returns False if already tracked."""
+        if channel in self._channel_set:
+            return False
+        self._channel_set.add(channel)
+        self.current_channels = self.current_channels + (channel,)
+        return True
+
+    def _remove_current_channel(self, channel: str) -> bool:
+        """Record that we left a channel. Returns False if it was not tracked."""
+        if channel not in self._channel_set:
+            return False
+        self._channel_set.discard(channel)
+        self.current_channels = tuple(c for c in self.current_channels if c != channel)
+        return True
 
     @staticmethod
     def _normalize_auto_commands(raw_commands: Any) -> List[str]:
@@ -955,43 +1124,34 @@ class IRCConnection:
             return []
 
         if isinstance(raw_nicks, str):
-            candidates = [part.strip() for part in raw_nicks.replace("\n", ",").split(",")]
+            candidates = self._NICK_SPLIT_RE.split(raw_nicks)
         elif isinstance(raw_nicks, list):
             candidates = []
             for item in raw_nicks:
                 if item is None:
                     continue
                 if isinstance(item, str):
-                    candidates.extend(
-                        [part.strip() for part in item.replace("\n", ",").split(",")]
-                    )
+                    candidates.extend(self._NICK_SPLIT_RE.split(item))
                 else:
-                    candidates.append(str(item).strip())
+                    candidates.append(str(item))
         else:
-            candidates = [str(raw_nicks).strip()]
+            candidates = [str(raw_nicks)]
 
-        normalized = []
-        seen = set()
-        base_lower = (self.base_nickname or "").lower()
-        for nick in candidates:
-            if not nick:
-                continue
-            if nick.lower() == base_lower:
-                continue
-            key = nick.lower()
-            if key in seen:
-                continue
-            seen.add(key)
-            normalized.append(nick)
+        # Deduplicate case-insensitively, keeping the first spelling seen
+        unique: Dict[str, str] = {}
+        for nick in (candidate.strip() for candidate in candidates):
+            if nick:
+                unique.setdefault(nick.lower(), nick)
+        unique.pop((self.base_nickname or "").lower(), None)
 
-        return normalized
+        return list(unique.values())
 
     def _next_alternate_nick(self) -> Optional[str]:
         """Return the next alternate nick to try, if any."""
         while self._alternate_nick_index < len(self.alternate_nicks):
             candidate = self.alternate_nicks[self._alternate_nick_index]
             self._alternate_nick_index += 1
-            if candidate and candidate.lower() != self.nickname.lower():
+            if candidate and candidate.lower() != self._nick_lower:
                 return candidate
         return None
 
@@ -1063,54 +1223,81 @@ class IRCConnection:
         args = parts[1] if len(parts) > 1 else ""
 
         try:
-            if cmd in ("msg", "query"):
-                msg_parts = args.split(None, 1)
-                if len(msg_parts) >= 2:
-                    target = msg_parts[0].lstrip("@+%~&")
-                    message = msg_parts[1]
-                    self.send_message(target, message)
-                else:
-                    print(f"Auto-connect /{cmd} missing target or message on {self.server_name}")
-            elif cmd in ("raw", "quote"):
-                if args:
-                    self.irc.quote(args)
-            elif cmd == "nick" and args:
-                self.irc.quote(f"NICK {args}")
-            elif cmd == "mode" and args:
-                self.irc.quote(f"MODE {args}")
-            elif cmd == "join" and args:
-                self.irc.quote(f"JOIN {args}")
-            elif cmd in ("part", "leave") and args:
-                self.irc.quote(f"PART {args}")
-            elif cmd == "away":
-                if args:
-                    self.irc.quote(f"AWAY :{args}")
-                else:
-                    self.irc.quote("AWAY")
-            elif cmd == "whois" and args:
-                self.irc.quote(f"WHOIS {args}")
-            elif cmd == "invite" and args:
-                invite_parts = args.split(None, 1)
-                if len(invite_parts) >= 2:
-                    nick = invite_parts[0].lstrip("@+%~&")
-                    channel = invite_parts[1]
-                    self.irc.quote(f"INVITE {nick} {channel}")
-                else:
-                    print(f"Auto-connect /invite missing channel on {self.server_name}")
-            elif cmd == "topic" and args:
-                topic_parts = args.split(None, 1)
-                if len(topic_parts) >= 2:
-                    channel = topic_parts[0]
-                    topic = topic_parts[1]
-                    self.irc.quote(f"TOPIC {channel} :{topic}")
-                else:
-                    print(f"Auto-connect /topic missing channel or topic on {self.server_name}")
-            else:
+            fmt = _AUTO_COMMAND_QUOTES.get(cmd)
+            if fmt and args:
+                self.irc.quote(fmt.format(args=args))
+                return
+
+            handler = self._AUTO_COMMAND_HANDLERS.get(cmd)
+            if handler is None or not handler(self, cmd, args):
                 # Fall back to sending the raw command without the slash.
                 self.irc.quote(raw[1:])
         except Exception as e:
             print(f"Failed to send auto-connect command on {self.server_name}: {e}")
 
+    def _auto_command_msg(self, cmd: str, args: str) -> bool:
+        """Handle auto-connect /msg and /query."""
+        msg_parts = args.split(None, 1)
+        if len(msg_parts) >= 2:
+            target = msg_parts[0].lstrip("@+%~&")
+            message = msg_parts[1]
+            self.send_message(target, message)
+        else:
+            print(f"Auto-connect /{cmd} missing target or message on {self.server_name}")
+        return True
+
+    def _auto_command_raw(self, cmd: str, args: str) -> bool:
+        """Handle auto-connect /raw and /quote."""
+        if args:
+            self.irc.quote(args)
+        return True
+
+    def _auto_command_away(self, cmd: str, args: str) -> bool:
+        """Handle auto-connect /away."""
+        if args:
+            self.irc.quote(f"AWAY :{args}")
+        else:
+            self.irc.quote("AWAY")
+        return True
+
+    def _auto_command_invite(self, cmd: str, args: str) -> bool:
+        """Handle auto-connect /invite."""
+        if not args:
+            return False
+        invite_parts = args.split(None, 1)
+        if len(invite_parts) >= 2:
+            nick = invite_parts[0].lstrip("@+%~&")
+            channel = invite_parts[1]
+            self.irc.quote(f"INVITE {nick} {channel}")
+        else:
+            print(f"Auto-connect /invite missing channel on {self.server_name}")
+        return True
+
+    def _auto_command_topic(self, cmd: str, args: str) -> bool:
+        """Handle auto-connect /topic."""
+        if not args:
+            return False
+        topic_parts = args.split(None, 1)
+        if len(topic_parts) >= 2:
+            channel = topic_parts[0]
+            topic = topic_parts[1]
+            self.irc.quote(f"TOPIC {channel} :{topic}")
+        else:
+            print(f"Auto-connect /topic missing channel or topic on {self.server_name}")
+        return True
+
+    # Auto-connect slash commands that need more than a simple rewrite.
+    # Handlers return False to fall back to sending the raw command.
+    _AUTO_COMMAND_HANDLERS = {
+        "msg": _auto_command_msg,
+        "query": _auto_command_msg,
+        "raw": _auto_command_raw,
+        "quote": _auto_command_raw,
+        "away": _auto_command_away,
+        "invite": _auto_command_invite,
+        "topic": _auto_command_topic,
+    }
+
     def request_channel_list(self) -> bool:
         """
         Request channel list from server
@@ -1144,10 +1331,21 @@ class IRCConnection:
         Returns:
             Maximum safe message length in bytes
         """
+        key = (target, extra_overhead)
+        max_length = self._max_length_cache.get(key)
+        if max_length is not None:
+            return max_length
+
+        target_length = len(target) if target.isascii() else len(target.encode('utf-8'))
         # Format: PRIVMSG target :message\r\n
         # Overhead: "PRIVMSG " (8) + target + " :" (2) + "\r\n" (2) + hostmask buffer
-        overhead = 8 + len(target.encode('utf-8')) + 2 + 2 + self.IRC_HOSTMASK_BUFFER + extra_overhead
-        return self.IRC_MAX_LINE - overhead
+        overhead = 8 + target_length + 2 + 2 + self.IRC_HOSTMASK_BUFFER + extra_overhead
+        max_length = self.IRC_MAX_LINE - overhead
+
+        if len(self._max_length_cache) >= self.MAX_LENGTH_CACHE_SIZE:
+            self._max_length_cache.clear()
+        self._max_length_cache[key] = max_length
+        return max_length
 
     def _split_message(self, message: str, max_length: int) -> List[str]:
         """
@@ -1162,54 +1360,52 @@ class IRCConnection:
         Returns:
             List of message chunks
         """
-        if len(message.encode('utf-8')) <= max_length:
-            return [message]
+        if message.isascii():
+            # One byte per character, so no encode is needed to check the fit
+            if len(message) <= max_length:
+                return [message]
+            data = message.encode('ascii')
+        else:
+            data = message.encode('utf-8')
+            if len(data) <= max_length:
+                return [message]
 
+        # Walk offsets over the encoded message instead of re-slicing the
+        # remainder each time, so long messages are not copied per chunk.
         chunks = []
-        remaining = message
-
-        while remaining:
-            # Encode to check byte length
-            remaining_bytes = remaining.encode('utf-8')
+        start = 0
+        end = len(data)
 
-            if len(remaining_bytes) <= max_length:
-                chunks.append(remaining)
+        while start < end:
+            if end - start <= max_length:
+                chunks.append(data[start:].decode('utf-8'))
                 break
 
-            # Find a good split point
-            # Start at max_length and work backwards to find a space
-            split_point = max_length
-
-            # Decode back to find character boundary
-            # This handles multi-byte UTF-8 characters properly
-            chunk_bytes = remaining_bytes[:split_point]
-            # Decode, potentially truncating a multi-byte character
-            try:
-                chunk = chunk_bytes.decode('utf-8')
-            except UnicodeDecodeError:
-                # We cut in the middle of a multi-byte character, back up
-                while split_point > 0:
-                    split_point -= 1
-                    try:
-                        chunk = remaining_bytes[:split_point].decode('utf-8')
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                else:
-                    # Couldn't decode anything, shouldn't happen
-                    chunk = remaining[:max_length // 4]  # Conservative fallback
-
-            # Try to split on a word boundary (space)
-            last_space = chunk.rfind(' ')
-            if last_space > max_length // 2:  # Only if space is in second half
-                chunk = chunk[:last_space]
+            # Start at max_length and back up to a character boundary.
+            # UTF-8 continuation bytes look like 10xxxxxx, so skip over them.
+            split_point = start + max_length
+            while split_point > start and (data[split_point] & 0xC0) == 0x80:
+                split_point -= 1
+
+            if split_point == start:
+                # A single character is wider than max_length; send it whole
+                # rather than looping forever on an empty chunk.
+                split_point = start + 1
+                while split_point < end and (data[split_point] & 0xC0) == 0x80:
+                    split_point += 1
+            else:
+                # Try to split on a word boundary (space), only if in second half
+                last_space = data.rfind(b' ', start + max_length // 2 + 1, split_point)
+                if last_space != -1:
+                    split_point = last_space
 
-            chunks.append(chunk)
-            remaining = remaining[len(chunk):].lstrip()  # Remove leading spaces from next chunk
+            chunks.append(data[start:split_point].decode('utf-8'))
+            # Remove leading spaces from next chunk
+            start = _LEADING_WHITESPACE_RE.match(data, split_point).end()
 
         return chunks
 
-    def send_message(self, target: str, message: str) -> List[str]:
+    def send_message(self, target: str, message: str) -> Sequence[str]:
         """
         Send message to channel or user, splitting if necessary.
 
@@ -1224,23 +1420,68 @@ class IRCConnection:
             List of message chunks that were sent
         """
         if not self.irc or not self.connected:
-            return []
+            return _EMPTY
 
         max_length = self._calculate_max_message_length(target)
         chunks = self._split_message(message, max_length)
 
-        sent_chunks = []
-        for chunk in chunks:
-            try:
-                self.irc.msg(target, chunk)
-                sent_chunks.append(chunk)
-            except Exception as e:
-                print(f"Failed to send message to {target}: {e}")
-                break
+        self.send_queue.extend([f"PRIVMSG {target} :{chunk}" for chunk in chunks])
+        if not self.send_queue.schedule_flush():
+            # Don't let callers echo or log lines that may not have gone out
+            return _EMPTY
 
-        return sent_chunks
+        return chunks
 
-    def send_action(self, target: str, action: str) -> List[str]:
+    def send_message_multi(self, targets: List[str], message: str) -> Dict[str, List[str]]:
+        """
+        Send the same message to several targets, sharing PRIVMSG lines.
+
+        Targets are grouped into comma-separated lists (PRIVMSG #a,#b :text)
+        of up to MAX_MESSAGE_TARGETS, as long as the message still fits in
+        a single line for the whole group. Messages too long for one line
+        are sent to each target separately.
+
+        Args:
+            targets: Channel names or nicks
+            message: Message to send
+
+        Returns:
+            Dict of target -> message chunks that were sent to it
+        """
+        if not self.irc or not self.connected:
+            return {}
+
+        message_length = len(message) if message.isascii() else len(message.encode('utf-8'))
+        groups: List[List[str]] = []
+        group: List[str] = []
+        for target in dict.fromkeys(targets):
+            if group and len(group) < self.MAX_MESSAGE_TARGETS:
+                joined = ",".join(group) + "," + target
+                if self._calculate_max_message_length(joined) >= message_length:
+                    group.append(target)
+                    continue
+            if group:
+                groups.append(group)
+            group = [target]
+        if group:
+            groups.append(group)
+
+        sent: Dict[str, List[str]] = {}
+        lines = []
+        for group in groups:
+            joined = ",".join(group)
+            chunks = self._split_message(message, self._calculate_max_message_length(joined))
+            lines.extend([f"PRIVMSG {joined} :{chunk}" for chunk in chunks])
+            for target in group:
+                sent[target] = chunks
+
+        self.send_queue.extend(lines)
+        if not self.send_queue.schedule_flush():
+            return {}
+
+        return sent
+
+    def send_action(self, target: str, action: str) -> Sequence[str]:
         """
         Send CTCP ACTION message (/me), splitting if necessary.
 
@@ -1255,23 +1496,18 @@ class IRCConnection:
             List of action chunks that were sent
         """
         if not self.irc or not self.connected:
-            return []
+            return _EMPTY
 
-        # CTCP ACTION format: \x01ACTION text\x01 adds 9 bytes overhead
-        ctcp_overhead = 9  # \x01ACTION \x01
-        max_length = self._calculate_max_message_length(target, ctcp_overhead)
+        max_length = self._calculate_max_message_length(target, self._CTCP_ACTION_OVERHEAD)
         chunks = self._split_message(action, max_length)
 
-        sent_chunks = []
-        for chunk in chunks:
-            try:
-                self.irc.msg(target, f"\x01ACTION {chunk}\x01")
-                sent_chunks.append(chunk)
-            except Exception as e:
-                print(f"Failed to send action to {target}: {e}")
-                break
+        line_prefix = "".join(("PRIVMSG ", target, " :", self._CTCP_ACTION_PREFIX))
+        suffix = self._CTCP_DELIM
+        self.send_queue.extend(["".join((line_prefix, chunk, suffix)) for chunk in chunks])
+        if not self.send_queue.schedule_flush():
+            return _EMPTY
 
-        return sent_chunks
+        return chunks
 
     def send_ctcp(self, target: str, message: str) -> None:
         """
@@ -1282,10 +1518,92 @@ class IRCConnection:
             message: CTCP message content (without \\x01 wrappers)
         """
         if self.irc and self.connected:
-            try:
-                self.irc.msg(target, f"\x01{message}\x01")
-            except Exception as e:
-                print(f"Failed to send CTCP to {target}: {e}")
+            self.send_queue.append(
+                "".join(("PRIVMSG ", target, " :", self._CTCP_DELIM, message, self._CTCP_DELIM)),
+                priority=True
+            )
+            self.send_queue.schedule_flush()
+
+    def _write_lines(self, lines: List[str]) -> bool:
+        """
+        Write a batch of queued lines to the server
+
+        Lines go through miniirc's public quote(), which handles partial
+        writes, timeouts and queuing before registration completes.
+
+        Args:
+            lines: Raw IRC lines without trailing CRLF
+
+        Returns:
+            True if every line was handed to miniirc
+        """
+        irc = self.irc
+        if not irc:
+            return False
+
+        try:
+            for line in lines:
+                irc.quote(line)
+        except Exception as e:
+            print(f"Failed to send to {self.server_name}: {e}")
+            return False
+        return True
+
+    @contextmanager
+    def burst(self) -> Iterator[None]:
+        """
+        Hold back partially filled TCP segments while sending several messages
+
+        On Linux this sets TCP_CORK on the socket so back-to-back sends leave
+        in full segments, and clears it on exit to flush the remainder.
+        Nested bursts only uncork when the outermost one exits. Elsewhere
+        this is a no-op.
+        """
+        self._burst_depth += 1
+        if self._burst_depth == 1:
+            self._set_cork(True)
+        try:
+            yield
+        finally:
+            self._burst_depth -= 1
+            if self._burst_depth == 0:
+                self._set_cork(False)
+
+    def _tune_socket(self) -> None:
+        """
+        Adjust the connection's current socket for interactive traffic
+
+        Disables Nagle's algorithm so a lone chat line is not held back
+        waiting for the previous one to be acknowledged (burst() still
+        corks deliberate groups of sends), and caps send queue batches at
+        half the socket's send buffer.
+        """
+        sock = getattr(self.irc, "sock", None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+        try:
+            sndbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+        except OSError:
+            return
+        if sndbuf > 0:
+            self.send_queue.max_batch_bytes = min(sndbuf // 2, self.MAX_SEND_BATCH_BYTES)
+
+    def _set_cork(self, enabled: bool) -> None:
+        """Set or clear TCP_CORK on the connection's socket, if supported."""
+        if not hasattr(socket, "TCP_CORK") or not self.irc:
+            return
+        sock = getattr(self.irc, "sock", None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1 if enabled else 0)
+        except OSError:
+            # Socket closed or not TCP; sends simply go out uncorked
+            pass
 
     def join_channel(self, channel: str) -> None:
         """
@@ -1297,10 +1615,8 @@ class IRCConnection:
         if self.irc and self.connected:
             if not channel.startswith("#"):
                 channel = "#" + channel
-            try:
-                self.irc.quote(f"JOIN {channel}")
-            except Exception as e:
-                print(f"Failed to join {channel}: {e}")
+            self.send_queue.append(f"JOIN {channel}", priority=True)
+            self.send_queue.schedule_flush()
 
     def part_channel(self, channel: str, reason: str = "") -> None:
         """
@@ -1311,13 +1627,11 @@ class IRCConnection:
             reason: Part reason (optional)
         """
         if self.irc and self.connected:
-            try:
-                if reason:
-                    self.irc.quote(f"PART {channel} :{reason}")
-                else:
-                    self.irc.quote(f"PART {channel}")
-            except Exception as e:
-                print(f"Failed to part {channel}: {e}")
+            if reason:
+                self.send_queue.append(f"PART {channel} :{reason}", priority=True)
+            else:
+                self.send_queue.append(f"PART {channel}", priority=True)
+            self.send_queue.schedule_flush()
 
     def disconnect(self, reason: str = "Leaving") -> None:
         """
@@ -1326,13 +1640,14 @@ class IRCConnection:
         Args:
             reason: Quit reason
         """
+        self.send_queue.clear()
         if self.irc:
             try:
                 # Send QUIT message before disconnecting
                 self.irc.quote(f"QUIT :{reason}")
                 self.irc.disconnect()
-                self.connected = False
-                GLib.idle_add(self.callbacks.get("on_disconnect"), self.server_name)
+                self._set_connected(False)
+                self._enqueue_dispatch("on_disconnect", self.server_name)
             except Exception as e:
                 print(f"Error during disconnect: {e}")
 
@@ -1344,11 +1659,46 @@ class IRCConnection:
             channel: Channel name
             nickname: User nickname
         """
-        if channel not in self.channel_users:
-            self.channel_users[channel] = set()
-        # Remove any existing entry for this nick (with or without prefix)
-        self._remove_user_variants(channel, nickname)
-        self.channel_users[channel].add(nickname)
+        with self._users_lock:
+            if channel not in self.channel_users:
+                self.channel_users[sys.intern(channel)] = set()
+            # Remove any existing entry for this nick (with or without prefix)
+            self._remove_user_variants(channel, nickname)
+            self._add_user_entry(channel, nickname)
+
+    def add_users_to_channel(self, channel: str, nicknames: List[str]) -> None:
+        """
+        Add many users to a channel's user list at once (NAMES replies)
+
+        Equivalent to calling add_user_to_channel for each name, but looks
+        up existing entries in one pass over the channel instead of one
+        pass per name, and re-sorts the user list once on the next read.
+
+        Args:
+            channel: Channel name
+            nicknames: User nicknames, with any mode prefix
+        """
+        channel = sys.intern(channel)
+        strip_prefix = self._strip_prefix
+        index = self._user_channels
+
+        with self._users_lock:
+            users = self.channel_users.setdefault(channel, set())
+            self._sorted_users.pop(channel, None)
+            self._user_snapshots.pop(channel, None)
+            stored = {strip_prefix(entry): entry for entry in users}
+
+            for nickname in nicknames:
+                base = sys.intern(strip_prefix(nickname))
+                existing = stored.get(base)
+                if existing == nickname:
+                    continue
+                if existing is not None:
+                    users.discard(existing)
+                entry = sys.intern(nickname)
+                users.add(entry)
+                stored[base] = entry
+                index.setdefault(base, set()).add(channel)
 
     def remove_user_from_channel(self, channel: str, nickname: str) -> None:
         """
@@ -1358,18 +1708,24 @@ class IRCConnection:
             channel: Channel name
             nickname: User nickname
         """
-        if channel in self.channel_users:
+        with self._users_lock:
             self._remove_user_variants(channel, nickname)
 
-    def remove_user_from_all_channels(self, nickname: str) -> None:
+    def remove_user_from_all_channels(self, nickname: str) -> List[str]:
         """
         Remove a user from all channels (used when they quit)
 
         Args:
             nickname: User nickname
+
+        Returns:
+            Channels the user was removed from
         """
-        for channel in self.channel_users:
-            self._remove_user_variants(channel, nickname)
+        with self._users_lock:
+            channels = list(self._user_channels.get(self._strip_prefix(nickname), ()))
+            for channel in channels:
+                self._remove_user_variants(channel, nickname)
+        return channels
 
     def rename_user(self, old_nick: str, new_nick: str) -> None:
         """
@@ -1379,18 +1735,37 @@ class IRCConnection:
             old_nick: Old nickname
             new_nick: New nickname
         """
-        for channel in self.channel_users:
-            existing = self._find_user_entry(channel, old_nick)
-            if existing is None:
-                continue
-            prefix = self._get_prefix(existing)
-            self._remove_user_variants(channel, old_nick)
-            if prefix:
-                self.channel_users[channel].add(f"{prefix}{new_nick}")
-            else:
-                self.channel_users[channel].add(new_nick)
+        with self._users_lock:
+            for channel in list(self._user_channels.get(self._strip_prefix(old_nick), ())):
+                existing = self._find_user_entry(channel, old_nick)
+                if existing is None:
+                    continue
+                prefix = self._get_prefix(existing)
+                self._remove_user_variants(channel, old_nick)
+                if prefix:
+                    self._add_user_entry(channel, f"{prefix}{new_nick}")
+                else:
+                    self._add_user_entry(channel, new_nick)
 
-    def get_channel_users(self, channel: str) -> List[str]:
+    def channels_for_user(self, nickname: str) -> Tuple[str, ...]:
+        """
+        Get the channels a user is in, whatever their mode prefix
+
+        Safe to call from any thread.
+
+        Args:
+            nickname: User nickname, with or without a mode prefix
+
+        Returns:
+            Tuple of channel names, in the order the channels were joined
+        """
+        with self._users_lock:
+            channels = self._user_channels.get(self._strip_prefix(nickname))
+            if not channels:
+                return ()
+            return tuple(channel for channel in self.channel_users if channel in channels)
+
+    def get_channel_users(self, channel: str) -> Sequence[str]:
         """
         Get list of users in a channel
 
@@ -1398,11 +1773,24 @@ class IRCConnection:
             channel: Channel name
 
         Returns:
-            Sorted list of usernames
-        """
-        if channel in self.channel_users:
-            return sorted(list(self.channel_users[channel]))
-        return []
+            Sorted tuple of usernames. It is an immutable snapshot, safe to
+            keep or hand to another thread; the same tuple is returned until
+            membership changes.
+        """
+        snapshot = self._user_snapshots.get(channel)
+        if snapshot is not None:
+            return snapshot
+        with self._users_lock:
+            users = self.channel_users.get(channel)
+            if users is None:
+                return _EMPTY
+            sorted_users = self._sorted_users.get(channel)
+            if sorted_users is None:
+                sorted_users = sorted(users)
+                self._sorted_users[channel] = sorted_users
+            snapshot = tuple(sorted_users)
+            self._user_snapshots[channel] = snapshot
+        return snapshot
 
     def clear_channel_users(self, channel: str) -> None:
         """
@@ -1411,8 +1799,13 @@ class IRCConnection:
         Args:
             channel: Channel name
         """
-        if channel in self.channel_users:
-            del self.channel_users[channel]
+        with self._users_lock:
+            users = self.channel_users.pop(channel, None)
+            if users:
+                for entry in users:
+                    self._unindex_user(channel, entry)
+            self._sorted_users.pop(channel, None)
+            self._user_snapshots.pop(channel, None)
 
     def _strip_prefix(self, nickname: str) -> str:
         """Strip common IRC mode prefixes from a nickname."""
@@ -1448,9 +1841,46 @@ class IRCConnection:
             if self._strip_prefix(entry) == base:
                 if removed is None:
                     removed = entry
-                self.channel_users[channel].discard(entry)
+                self._discard_user_entry(channel, entry)
         return removed
 
+    def _add_user_entry(self, channel: str, entry: str) -> None:
+        """Add a stored entry, keeping the channel's sorted list in step."""
+        users = self.channel_users[channel]
+        if entry in users:
+            return
+        # Intern what we store: the same nicks and channels recur across
+        # every channel set and the reverse index
+        entry = sys.intern(entry)
+        users.add(entry)
+        base = sys.intern(self._strip_prefix(entry))
+        self._user_channels.setdefault(base, set()).add(sys.intern(channel))
+        self._user_snapshots.pop(channel, None)
+        sorted_users = self._sorted_users.get(channel)
+        if sorted_users is not None:
+            insort(sorted_users, entry)
+
+    def _discard_user_entry(self, channel: str, entry: str) -> None:
+        """Remove a stored entry, keeping the channel's sorted list in step."""
+        users = self.channel_users[channel]
+        if entry not in users:
+            return
+        users.discard(entry)
+        self._unindex_user(channel, entry)
+        self._user_snapshots.pop(channel, None)
+        sorted_users = self._sorted_users.get(channel)
+        if sorted_users is not None:
+            del sorted_users[bisect_left(sorted_users, entry)]
+
+    def _unindex_user(self, channel: str, entry: str) -> None:
+        """Drop a channel from a user's reverse index entry."""
+        base = self._strip_prefix(entry)
+        channels = self._user_channels.get(base)
+        if channels is not None:
+            channels.discard(channel)
+            if not channels:
+                del self._user_channels[base]
+
     def _pick_higher_prefix(self, current: str, new: str) -> str:
         """Pick the higher-ranked prefix between current and new."""
         if not current:
@@ -1490,34 +1920,28 @@ class IRCConnection:
 
         self._remove_user_variants(channel, base)
         display = f"{new_prefix}{base}" if new_prefix else base
-        self.channel_users[channel].add(display)
+        self._add_user_entry(channel, display)
         return True
 
     def _parse_mode_changes(self, mode_str: str, params: List[str]) -> List[tuple]:
         """Parse MODE changes into a list of (sign, mode, nick) for user modes."""
         changes = []
         sign = "+"
-        param_index = 0
+        param_iter = iter(params)
 
-        for ch in mode_str:
-            if ch in "+-":
-                sign = ch
+        for match in self._MODE_TOKEN_RE.finditer(mode_str):
+            ch = match.group(2)
+            if ch is None:
+                sign = match.group(1)
                 continue
 
-            needs_param = False
-            if ch in self.MODE_PARAMS_ALWAYS:
-                needs_param = True
-            elif ch in self.MODE_PARAMS_ON_SET and sign == "+":
-                needs_param = True
-
             param = None
-            if needs_param:
-                if param_index >= len(params):
+            if ch in self.MODE_PARAMS_ALWAYS or (sign == "+" and ch in self.MODE_PARAMS_ON_SET):
+                param = next(param_iter, None)
+                if param is None:
                     break
-                param = params[param_index]
-                param_index += 1
 
-            if ch in self.USER_MODE_PREFIXES and param:
+            if param and ch in self.USER_MODE_PREFIXES:
                 changes.append((sign, ch, param))
 
         return changes
@@ -1525,15 +1949,19 @@ class IRCConnection:
     def _apply_mode_changes(self, channel: str, mode_str: str, params: List[str]) -> bool:
         """Apply user prefix updates from MODE changes."""
         changed = False
-        for sign, mode, nick in self._parse_mode_changes(mode_str, params):
-            if self._update_user_prefix(channel, nick, mode, sign):
-                changed = True
+        with self._users_lock:
+            for sign, mode, nick in self._parse_mode_changes(mode_str, params):
+                if self._update_user_prefix(channel, nick, mode, sign):
+                    changed = True
         return changed
 
 
 class IRCManager:
     """Manages multiple IRC server connections"""
 
+    # Minimum seconds between "Not connected" notices for the same server
+    MISS_REPORT_INTERVAL = 1.0
+
     def __init__(self, config_manager, callbacks: Dict[str, Callable]):
         """
         Initialize IRC manager
@@ -1544,8 +1972,67 @@ class IRCManager:
         """
         self.config = config_manager
         self.callbacks = callbacks
+        # Copy-on-write: the dict is replaced, never mutated in place, so
+        # readers can use whatever snapshot they see without locking.
         self.connections: Dict[str, IRCConnection] = {}
-        self._connections_lock = threading.Lock()  # Protect connections dict access
+        self._connections_lock = threading.Lock()  # Serialize connections updates
+
+        # Connected servers, kept current by the connections themselves via
+        # _on_connected_change: a flag per server plus a tuple in connect
+        # order that is replaced (never mutated) on change
+        self._connected_flags: Dict[str, bool] = {}
+        self._connected_servers: Tuple[str, ...] = ()
+
+        # "Not connected" reports per server: name -> (last report time, suppressed count)
+        self._miss_reports: Dict[str, Tuple[float, int]] = {}
+
+    @property
+    def connections(self) -> Dict[str, IRCConnection]:
+        """Current snapshot of server name -> connection (do not modify)."""
+        return self._connections
+
+    @connections.setter
+    def connections(self, connections: Dict[str, IRCConnection]) -> None:
+        self._connections = connections
+        # Bind the snapshot's own get() so per-server lookups are a single
+        # C call rather than a Python method that then looks up the dict
+        self._get_connection: Callable[[str], Optional[IRCConnection]] = connections.get
+
+    def _on_connected_change(self, server_name: str, connected: bool) -> None:
+        """
+        Record a server connecting or disconnecting
+
+        Called by connections from whichever thread changed their state.
+
+        Args:
+            server_name: Name of server
+            connected: New connected state
+        """
+        with self._connections_lock:
+            if connected:
+                self._connected_flags[server_name] = True
+                if server_name not in self._connected_servers:
+                    self._connected_servers = self._connected_servers + (server_name,)
+            else:
+                self._connected_flags.pop(server_name, None)
+                if server_name in self._connected_servers:
+                    self._connected_servers = tuple(
+                        name for name in self._connected_servers if name != server_name
+                    )
+
+    def _report_not_connected(self, server_name: str) -> None:
+        """
+        Print a "Not connected" notice, at most once per interval per server
+
+        Repeated sends to a missing server are counted instead of printed,
+        and the count is included in the next notice that gets through.
+
+        Args:
+            server_name: Name of server that was not found
+        """
+        print_rate_limited(self._miss_reports, server_name,
+                           f"Not connected to {server_name}",
+                           self.MISS_REPORT_INTERVAL)
 
     def connect_server(self, server_config: Dict[str, Any]) -> bool:
         """
@@ -1554,11 +2041,20 @@ class IRCManager:
         Args:
             server_config: Server configuration dict
 
+        The TCP connect, TLS handshake and DNS lookup run on a background
+        thread so the GUI stays responsive. The connection is listed in
+        connections straight away; if it then fails, the error is reported
+        through the on_connection_error callback and it is removed again.
+
         Returns:
             True if connection initiated successfully
         """
         server_name = server_config.get("name", "Unknown")
 
+        if not MINIIRC_AVAILABLE:
+            print("miniirc not available")
+            return False
+
         # Don't connect if already connected
         if server_name in self.connections:
             print(f"Already connected to {server_name}")
@@ -1574,13 +2070,51 @@ class IRCManager:
 
         # Create connection
         connection = IRCConnection(server_config, self.callbacks)
+        connection.on_connected_change = self._on_connected_change
+
+        with self._connections_lock:
+            if server_name in self.connections:
+                print(f"Already connected to {server_name}")
+                return False
+            connections = dict(self.connections)
+            # Key by the connection's interned name: events carry that
+            # same object, so their lookups match on identity
+            connections[connection.server_name] = connection
+            self.connections = connections
+
+        thread = threading.Thread(
+            target=self._connect_in_background,
+            args=(connection,),
+            daemon=True
+        )
+        thread.start()
+        return True
+
+    def _connect_in_background(self, connection: IRCConnection) -> None:
+        """
+        Run a connection attempt off the GTK main thread
 
-        # Try to connect
+        Args:
+            connection: Connection registered by connect_server
+        """
         if connection.connect():
-            self.connections[server_name] = connection
-            return True
-        else:
-            return False
+            with self._connections_lock:
+                cancelled = connection.cancelled
+            if cancelled and connection.irc:
+                # Disconnected while connecting; nothing owns this session
+                # any more, so don't leave it running
+                try:
+                    connection.irc.disconnect()
+                except Exception as e:
+                    print(f"Error during disconnect: {e}")
+            return
+        # connect() already reported the error; forget the failed attempt
+        # unless it has been disconnected or replaced in the meantime
+        with self._connections_lock:
+            if self.connections.get(connection.server_name) is connection:
+                connections = dict(self.connections)
+                del connections[connection.server_name]
+                self.connections = connections
 
     def disconnect_server(self, server_name: str, reason: str = "Leaving") -> None:
         """
@@ -1590,10 +2124,15 @@ class IRCManager:
             server_name: Name of server to disconnect from
             reason: Quit reason
         """
-        connection = self.connections.get(server_name)
+        with self._connections_lock:
+            connections = dict(self.connections)
+            connection = connections.pop(server_name, None)
+            self.connections = connections
+            if connection:
+                connection.cancelled = True
         if connection:
             connection.disconnect(reason)
-            del self.connections[server_name]
+        self._on_connected_change(server_name, False)
 
     def disconnect_all(self, reason: str = "Leaving") -> None:
         """
@@ -1605,7 +2144,7 @@ class IRCManager:
         for server_name in list(self.connections.keys()):
             self.disconnect_server(server_name, reason)
 
-    def send_message(self, server_name: str, target: str, message: str) -> List[str]:
+    def send_message(self, server_name: str, target: str, message: str) -> Sequence[str]:
         """
         Send message to channel or user, splitting if necessary.
 
@@ -1620,14 +2159,54 @@ class IRCManager:
         Returns:
             List of message chunks that were sent
         """
-        connection = self.connections.get(server_name)
+        connection = self._get_connection(server_name)
         if connection:
             return connection.send_message(target, message)
         else:
-            print(f"Not connected to {server_name}")
-            return []
+            self._report_not_connected(server_name)
+            return _EMPTY
 
-    def send_action(self, server_name: str, target: str, action: str) -> List[str]:
+    def reply(self, target: str, message: str) -> Sequence[str]:
+        """
+        Send a message on the server whose event is being handled
+
+        Only meaningful inside an IRC event callback (and plugin hooks called
+        from one), where the connection is already known and no server
+        lookup is needed.
+
+        Args:
+            target: Channel name or nick
+            message: Message to send
+
+        Returns:
+            List of message chunks that were sent (empty outside a callback)
+        """
+        connection = _current_connection.get()
+        return connection.send_message(target, message) if connection else _EMPTY
+
+    def send_message_multi(self, server_name: str, targets: List[str], message: str) -> Dict[str, List[str]]:
+        """
+        Send the same message to several channels or users on one server
+
+        Targets share PRIVMSG lines where the message fits, so announcing
+        to N channels costs far fewer lines than N send_message calls.
+
+        Args:
+            server_name: Name of server
+            targets: Channel names or nicks
+            message: Message to send
+
+        Returns:
+            Dict of target -> message chunks that were sent to it
+        """
+        connection = self._get_connection(server_name)
+        if connection:
+            return connection.send_message_multi(targets, message)
+        else:
+            self._report_not_connected(server_name)
+            return {}
+
+    def send_action(self, server_name: str, target: str, action: str) -> Sequence[str]:
         """
         Send CTCP ACTION message (/me), splitting if necessary.
 
@@ -1642,12 +2221,12 @@ class IRCManager:
         Returns:
             List of action chunks that were sent
         """
-        connection = self.connections.get(server_name)
+        connection = self._get_connection(server_name)
         if connection:
             return connection.send_action(target, action)
         else:
-            print(f"Not connected to {server_name}")
-            return []
+            self._report_not_connected(server_name)
+            return _EMPTY
 
     def send_ctcp(self, server_name: str, target: str, message: str) -> None:
         """
@@ -1658,11 +2237,31 @@ class IRCManager:
             target: Target nickname
             message: CTCP message content (without \\x01 wrappers)
         """
-        connection = self.connections.get(server_name)
+        connection = self._get_connection(server_name)
         if connection:
             connection.send_ctcp(target, message)
         else:
-            print(f"Not connected to {server_name}")
+            self._report_not_connected(server_name)
+
+    @contextmanager
+    def burst(self, server_name: str) -> Iterator[None]:
+        """
+        Group several sends to a server into as few TCP segments as possible
+
+        Usage:
+            with irc_manager.burst(server_name):
+                for line in lines:
+                    irc_manager.send_message(server_name, target, line)
+
+        Args:
+            server_name: Name of server
+        """
+        connection = self._get_connection(server_name)
+        if not connection:
+            yield
+            return
+        with connection.burst():
+            yield
 
     def join_channel(self, server_name: str, channel: str) -> None:
         """
@@ -1672,7 +2271,7 @@ class IRCManager:
             server_name: Name of server
             channel: Channel name
         """
-        connection = self.connections.get(server_name)
+        connection = self._get_connection(server_name)
         if connection:
             connection.join_channel(channel)
 
@@ -1685,7 +2284,7 @@ class IRCManager:
             channel: Channel name
             reason: Part reason
         """
-        connection = self.connections.get(server_name)
+        connection = self._get_connection(server_name)
         if connection:
             connection.part_channel(channel, reason)
 
@@ -1699,14 +2298,19 @@ class IRCManager:
         Returns:
             True if connected
         """
-        connection = self.connections.get(server_name)
-        return connection.connected if connection else False
+        return self._connected_flags.get(server_name, False)
 
-    def get_connected_servers(self) -> List[str]:
-        """Get list of connected server names"""
-        return [name for name, conn in self.connections.items() if conn.connected]
+    def get_connected_servers(self) -> Sequence[str]:
+        """
+        Get connected server names, in the order they connected
+
+        Returns:
+            Tuple of server names, replaced (not modified) when a server
+            connects or disconnects
+        """
+        return self._connected_servers
 
-    def get_channels(self, server_name: str) -> List[str]:
+    def get_channels(self, server_name: str) -> Sequence[str]:
         """
         Get list of channels for a server
 
@@ -1714,12 +2318,13 @@ class IRCManager:
             server_name: Name of server
 
         Returns:
-            List of channel names
+            Tuple of channel names, replaced (not modified) when we join or
+            leave a channel
         """
-        connection = self.connections.get(server_name)
-        return connection.current_channels if connection else []
+        connection = self._get_connection(server_name)
+        return connection.current_channels if connection else ()
 
-    def get_channel_users(self, server_name: str, channel: str) -> List[str]:
+    def get_channel_users(self, server_name: str, channel: str) -> Sequence[str]:
         """
         Get list of users in a channel on a server
 
@@ -1730,5 +2335,5 @@ class IRCManager:
         Returns:
             Sorted list of usernames
         """
-        connection = self.connections.get(server_name)
-        return connection.get_channel_users(channel) if connection else []
+        connection = self._get_connection(server_name)
+        return connection.get_channel_users(channel) if connection else _EMPTY
@@ -4,30 +4,122 @@ Log Manager for Access IRC
 Handles logging of IRC conversations to disk
 """
 
+import atexit
+import functools
 import os
+import queue
 import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+from .rate_limit import print_rate_limited
 
-class LogManager:
-    """Manages IRC conversation logging"""
+# Null bytes are dropped; characters unsafe in filenames become hyphens
+_SANITIZE_TABLE = str.maketrans({"\x00": None, **{c: "-" for c in '/\\:*?"<>|'}})
+
+# os.writev is POSIX-only, and os.fdatasync is missing on macOS and Windows
+_HAVE_WRITEV = hasattr(os, "writev")
+_fdatasync = getattr(os, "fdatasync", os.fsync)
 
-    def __init__(self, log_directory: Optional[str] = None):
+
+class LogManager:
+    """
+    Manages IRC conversation logging
+
+    The log_* methods only queue lines; a background writer thread resolves
+    log file paths, buffers lines per file and writes a buffer out once it
+    reaches buffer_size bytes or every flush_interval seconds. IRC threads
+    never touch the filesystem, and a busy channel costs a single writev()
+    per batch rather than an open/write/close per line. Remaining lines are
+    flushed at exit.
+    """
+
+    BUFFER_SIZE = 8192  # Minimum; raised to 4 filesystem blocks when larger
+    MAX_BUFFER_LINES = 1000  # Stays under IOV_MAX (1024 on Linux) for writev
+    FLUSH_INTERVAL = 1.0  # Seconds between background flushes
+    MAX_OPEN_FILES = 64  # Least recently used log files are closed beyond this
+    IDLE_FILE_TIMEOUT = 600.0  # Seconds before an unused log file is closed
+    MAX_CACHED_PATHS = 1024
+    SYNC_INTERVAL = 1.0  # Minimum seconds between syncs in durable mode
+    WRITER_TIMEOUT = 5.0  # Seconds to wait for the writer on flush/cleanup
+    ERROR_REPORT_INTERVAL = 1.0  # Seconds between printed logging errors
+
+    # Line formats by event kind; the first field is always the timestamp
+    _TEMPLATES = {
+        "message": "%s <%s> %s",
+        "action": "%s * %s %s",
+        "notice": "%s -%s- %s",
+        "join": "%s --> %s has joined %s",
+        "part": "%s <-- %s has left %s%s",
+        "quit": "%s <-- %s has quit%s",
+        "nick": "%s --- %s is now known as %s",
+        "kick": "%s <-! %s was kicked by %s%s",
+        "system": "%s * %s",
+    }
+
+    def __init__(self, log_directory: Optional[str] = None,
+                 buffer_size: Optional[int] = None, flush_interval: float = FLUSH_INTERVAL,
+                 durable: bool = False):
         """
         Initialize log manager
 
         Args:
             log_directory: Base directory for logs (None to disable logging)
+            buffer_size: Bytes buffered per log file before writing to disk
+                (None to size it from the log filesystem's block size)
+            flush_interval: Seconds between background flushes
+            durable: Sync written log files to disk (at most every
+                SYNC_INTERVAL seconds) instead of leaving it to the OS
         """
         self.log_directory = log_directory
         self.enabled = log_directory is not None and log_directory.strip() != ""
-        self._write_lock = threading.Lock()  # Protect concurrent writes
+        self._fixed_buffer_size = buffer_size
+        self.buffer_size = buffer_size or self.BUFFER_SIZE
+        self.flush_interval = flush_interval
+        self.durable = durable
+        # Pending bytes and open file descriptors, keyed by log file path.
+        # Only the writer thread touches these while it is running.
+        self._buffers: Dict[str, List[bytes]] = {}
+        self._buffered_bytes: Dict[str, int] = {}
+        self._fds: "OrderedDict[str, int]" = OrderedDict()
+        self._fd_used: Dict[str, float] = {}  # Monotonic time of last write
+
+        # Files written since the last sync (durable mode only)
+        self._unsynced: Set[str] = set()
+        self._last_sync = 0.0
+
+        # Formatted timestamp for the current second: (epoch second, "[HH:MM:SS]")
+        self._ts_cache: Tuple[int, str] = (0, "")
+
+        # (server, target) -> log file path for the current day
+        self._path_cache: Dict[Tuple[str, str], str] = {}
+
+        # "log" -> (time of last printed error, errors suppressed since then)
+        self._error_reports: Dict[str, Tuple[float, int]] = {}
+
+        # Current log file date and the epoch time at which it changes.
+        # _open_date is the date the writer's open files belong to.
+        self._log_date = ""
+        self._rollover_at = 0.0
+        self._open_date = ""
+
+        # Server directories already created under log_directory
+        self._known_dirs: Set[str] = set()
+
+        # Queue of (server, target, line) for the writer thread, which is
+        # started on the first logged line. A threading.Event in the queue
+        # asks for a flush, None asks the writer to flush and exit.
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()  # Protects writer startup
+        atexit.register(self.flush_all)
 
         # Create base log directory if it doesn't exist
         if self.enabled:
             self._ensure_directory_exists(self.log_directory)
+            self._update_buffer_size()
 
     def set_log_directory(self, log_directory: str, connected_servers: list = None) -> None:
         """
@@ -37,12 +129,18 @@ class LogManager:
             log_directory: Path to log directory
             connected_servers: List of currently connected server names (optional)
         """
+        # Lines already buffered belong to the old directory's files
+        self.flush_all()
+        self._path_cache.clear()
+        self._known_dirs.clear()
+
         self.log_directory = log_directory
         self.enabled = log_directory is not None and log_directory.strip() != ""
 
         if self.enabled:
             if not self._ensure_directory_exists(self.log_directory):
                 raise OSError(f"Failed to create log directory: {self.log_directory}")
+            self._update_buffer_size()
 
             # Proactively create directories for connected servers
             failed_servers = []
@@ -52,13 +150,45 @@ class LogManager:
                     if not server_name or not server_name.strip():
                         continue
 
-                    server_dir = Path(self.log_directory) / self._sanitize_name(server_name)
-                    if not self._ensure_directory_exists(str(server_dir)):
+                    server_dir = os.path.join(self.log_directory, self._sanitize_name(server_name))
+                    if not self._ensure_dir_cached(server_dir):
                         failed_servers.append(server_name)
 
             if failed_servers:
                 raise OSError(f"Failed to create directories for: {', '.join(failed_servers)}")
 
+    def _update_buffer_size(self) -> None:
+        """
+        Size log buffers to a multiple of the log filesystem's block size
+
+        Flushes then cover whole blocks, which the kernel can write back
+        without reading a partly filled block first. An explicit buffer_size
+        passed to the constructor is left alone.
+        """
+        if self._fixed_buffer_size is not None:
+            return
+        try:
+            block_size = os.statvfs(self.log_directory).f_bsize
+        except (AttributeError, OSError):
+            # statvfs is POSIX-only
+            block_size = 0
+        self.buffer_size = max(4 * block_size, self.BUFFER_SIZE)
+
+    def _report_error(self, message: str) -> None:
+        """
+        Print a logging error, at most once per interval
+
+        A full or failing disk makes every write fail; the errors in between
+        are counted instead of printed, and the count is included in the next
+        message that gets through.
+
+        Args:
+            message: Error description
+        """
+        # One shared limit: a failing disk fails every file alike
+        print_rate_limited(self._error_reports, "log", message,
+                           self.ERROR_REPORT_INTERVAL)
+
     def _ensure_directory_exists(self, directory: str) -> bool:
         """
         Ensure a directory exists, creating it if necessary
@@ -73,9 +203,26 @@ class LogManager:
             Path(directory).mkdir(parents=True, exist_ok=True)
             return True
         except (OSError, PermissionError) as e:
-            print(f"Failed to create directory {directory}: {e}")
+            self._report_error(f"Failed to create directory {directory}: {e}")
             return False
 
+    def _ensure_dir_cached(self, directory: str) -> bool:
+        """
+        Ensure a directory exists, skipping the mkdir if it was seen before
+
+        Args:
+            directory: Directory path
+
+        Returns:
+            True if directory exists or was created successfully
+        """
+        if directory in self._known_dirs:
+            return True
+        if not self._ensure_directory_exists(directory):
+            return False
+        self._known_dirs.add(directory)
+        return True
+
     def _get_log_file_path(self, server: str, target: str) -> Optional[str]:
         """
         Get the log file path for a server and target
@@ -90,19 +237,43 @@ class LogManager:
         if not self.enabled or not self.log_directory:
             return None
 
-        # Create server subdirectory
-        server_dir = Path(self.log_directory) / self._sanitize_name(server)
-        if not self._ensure_directory_exists(str(server_dir)):
+        # The path only changes when the date does, which clears the cache
+        if time.time() >= self._rollover_at:
+            self._rollover()
+        date_str = self._log_date
+        key = (server, target)
+        cached = self._path_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Create server subdirectory (plain string joins; this runs on the
+        # writer thread for every new target and day)
+        server_dir = os.path.join(self.log_directory, self._sanitize_name(server))
+        if not self._ensure_dir_cached(server_dir):
             return None
 
         # Create log filename with date: channel-YYYY-MM-DD.log
-        date_str = datetime.now().strftime("%Y-%m-%d")
         sanitized_target = self._sanitize_name(target)
-        filename = f"{sanitized_target}-{date_str}.log"
-
-        return str(server_dir / filename)
-
-    def _sanitize_name(self, name: str) -> str:
+        path = os.path.join(server_dir, f"{sanitized_target}-{date_str}.log")
+        if len(self._path_cache) >= self.MAX_CACHED_PATHS:
+            self._path_cache.clear()
+        self._path_cache[key] = path
+        return path
+
+    def _rollover(self) -> None:
+        """Switch to the current date's log files and schedule the next switch."""
+        now = time.time()
+        today = time.localtime(now)
+        self._log_date = time.strftime("%Y-%m-%d", today)
+        self._path_cache.clear()
+        # mktime normalises day overflow and picks the right DST offset
+        self._rollover_at = time.mktime(
+            (today.tm_year, today.tm_mon, today.tm_mday + 1, 0, 0, 0, 0, 0, -1)
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _sanitize_name(name: str) -> str:
         """
         Sanitize a name for use in file paths
 
@@ -114,13 +285,10 @@ class LogManager:
         """
         # Replace characters that might be problematic in filenames
         # Keep #, letters, numbers, hyphens, underscores
-        # Remove null bytes and path traversal sequences first (security)
-        safe_name = name.replace("\x00", "").replace("..", "")
-        safe_name = safe_name.replace("/", "-").replace("\\", "-")
-        safe_name = safe_name.replace(":", "-").replace("*", "-")
-        safe_name = safe_name.replace("?", "-").replace('"', "-")
-        safe_name = safe_name.replace("<", "-").replace(">", "-")
-        safe_name = safe_name.replace("|", "-")
+        # Null bytes and path traversal sequences are removed (security)
+        safe_name = name.translate(_SANITIZE_TABLE)
+        if ".." in safe_name:
+            safe_name = safe_name.replace("..", "")
 
         # Prevent empty names or names that are just dots/spaces
         safe_name = safe_name.strip(". ")
@@ -135,7 +303,11 @@ class LogManager:
 
     def _write_to_log(self, server: str, target: str, line: str) -> bool:
         """
-        Write a line to the appropriate log file
+        Queue a line for the appropriate log file
+
+        The writer thread resolves the path and buffers the line; it is
+        written to disk once that file's buffer reaches buffer_size bytes
+        or at the next periodic flush.
 
         Args:
             server: Server name
@@ -143,24 +315,354 @@ class LogManager:
             line: Line to write (should include timestamp)
 
         Returns:
-            True if successful, False otherwise
+            True if the line was queued, False if logging is disabled
         """
         if not self.enabled:
             return False
 
+        # Encoded here so the writer only ever handles bytes; malformed
+        # input (e.g. lone surrogates) is replaced rather than raising
+        self._queue.put((server, target, (line + '\n').encode('utf-8', 'replace')))
+        if self._writer is None:
+            self._start_writer()
+        return True
+
+    def _write_to_logs(self, server: str, targets: Sequence[str], line: str) -> bool:
+        """
+        Queue the same line for several log files
+
+        The line is encoded once and the same bytes object is queued for
+        every target.
+
+        Args:
+            server: Server name
+            targets: Channels or PM targets
+            line: Line to write (should include timestamp)
+
+        Returns:
+            True if the line was queued, False if logging is disabled
+        """
+        if not self.enabled:
+            return False
+
+        data = (line + '\n').encode('utf-8', 'replace')
+        put = self._queue.put
+        for target in targets:
+            put((server, target, data))
+        if self._writer is None:
+            self._start_writer()
+        return True
+
+    def _start_writer(self) -> None:
+        """Start the writer thread if it is not running."""
+        with self._writer_lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="log-writer", daemon=True
+            )
+            self._writer.start()
+
+    def _writer_loop(self) -> None:
+        """Run the writer, marking it stopped on exit so producers restart it."""
+        try:
+            self._write_queued_lines()
+        finally:
+            with self._writer_lock:
+                self._writer = None
+
+    def _write_queued_lines(self) -> None:
+        """Buffer queued lines and flush them until asked to stop."""
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = False  # Idle: time for a periodic flush
+
+            if item is None:
+                self._close_files()
+                return
+
+            if isinstance(item, tuple):
+                try:
+                    self._buffer_line(*item)
+                except Exception as e:
+                    self._report_error(f"Failed to log line for {item[0]}/{item[1]}: {e}")
+                if time.monotonic() - last_flush < self.flush_interval:
+                    continue
+
+            self._flush_buffers()
+            last_flush = time.monotonic()
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def _buffer_line(self, server: str, target: str, data: bytes) -> None:
+        """
+        Append a line to its log file's buffer, writing it out when full
+
+        Args:
+            server: Server name
+            target: Channel or PM target
+            data: Encoded line, including the trailing newline
+        """
         log_file = self._get_log_file_path(server, target)
         if not log_file:
-            return False
+            return
+
+        chunks = self._buffers.get(log_file)
+        if chunks is None:
+            chunks = self._buffers[log_file] = []
+        chunks.append(data)
+        size = self._buffered_bytes.get(log_file, 0) + len(data)
+        self._buffered_bytes[log_file] = size
+        if size >= self.buffer_size or len(chunks) >= self.MAX_BUFFER_LINES:
+            self._flush_buffer(log_file, chunks)
+
+    def _get_fd(self, log_file: str) -> int:
+        """
+        Get an open file descriptor for a log file, opening it if needed
+
+        Called on the writer thread. Files beyond MAX_OPEN_FILES are closed
+        least recently used first.
+
+        Args:
+            log_file: Path to log file
 
+        Returns:
+            File descriptor opened for appending
+        """
+        self._fd_used[log_file] = time.monotonic()
+        fd = self._fds.get(log_file)
+        if fd is not None:
+            self._fds.move_to_end(log_file)
+            return fd
+
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
         try:
-            # Use lock to protect against concurrent writes from multiple threads
-            with self._write_lock:
-                with open(log_file, 'a', encoding='utf-8') as f:
-                    f.write(line + '\n')
+            fd = os.open(log_file, flags, 0o644)
+        except FileNotFoundError:
+            # Directory was removed since it was cached; recreate it once
+            directory = os.path.dirname(log_file)
+            self._known_dirs.discard(directory)
+            if not self._ensure_dir_cached(directory):
+                raise
+            fd = os.open(log_file, flags, 0o644)
+        self._fds[log_file] = fd
+        while len(self._fds) > self.MAX_OPEN_FILES:
+            self._close_file(next(iter(self._fds)))
+        return fd
+
+    def _close_file(self, log_file: str) -> None:
+        """
+        Close a log file and forget its state. Called on the writer thread.
+
+        Args:
+            log_file: Path to log file
+        """
+        self._fd_used.pop(log_file, None)
+        if log_file in self._unsynced:
+            self._unsynced.discard(log_file)
+            fd = self._fds.get(log_file)
+            if fd is not None:
+                try:
+                    _fdatasync(fd)
+                except OSError:
+                    pass
+        if not self._buffers.get(log_file, True):
+            del self._buffers[log_file]
+            self._buffered_bytes.pop(log_file, None)
+        fd = self._fds.pop(log_file, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _close_idle_files(self) -> None:
+        """Close files not written for IDLE_FILE_TIMEOUT. Called on the writer thread."""
+        cutoff = time.monotonic() - self.IDLE_FILE_TIMEOUT
+        # _fds is kept in least recently used order
+        while self._fds:
+            log_file = next(iter(self._fds))
+            if self._fd_used.get(log_file, 0.0) > cutoff:
+                break
+            self._close_file(log_file)
+
+    def _flush_buffer(self, log_file: str, chunks: List[bytes]) -> bool:
+        """
+        Write a log file's buffered lines to disk. Called on the writer thread.
+
+        Args:
+            log_file: Path to log file
+            chunks: Buffered encoded lines for that file (cleared on return)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not chunks:
+            return True
+
+        try:
+            self._write_chunks(self._get_fd(log_file), chunks)
+            if self.durable:
+                self._unsynced.add(log_file)
             return True
         except (OSError, PermissionError) as e:
-            print(f"Failed to write to log file {log_file}: {e}")
+            self._report_error(f"Failed to write to log file {log_file}: {e}")
+            # Drop the descriptor so the next flush reopens the file
+            self._close_file(log_file)
             return False
+        finally:
+            chunks.clear()
+            self._buffered_bytes[log_file] = 0
+
+    @staticmethod
+    def _write_chunks(fd: int, chunks: List[bytes]) -> None:
+        """
+        Write a batch of byte strings to a file descriptor
+
+        Uses one vectored writev() call where available, falling back to
+        plain write() for any part the kernel did not accept.
+
+        Args:
+            fd: File descriptor opened for appending
+            chunks: Byte strings to write, in order
+        """
+        if _HAVE_WRITEV:
+            written = os.writev(fd, chunks)
+            if written == sum(map(len, chunks)):
+                return
+            data = b"".join(chunks)[written:]
+        else:
+            data = b"".join(chunks)
+
+        while data:
+            data = data[os.write(fd, data):]
+
+    def _flush_buffers(self) -> None:
+        """Write every non-empty buffer to disk. Called on the writer thread."""
+        # Opening a file can evict (and forget) another one; iterate a copy
+        for log_file, chunks in list(self._buffers.items()):
+            if chunks:
+                self._flush_buffer(log_file, chunks)
+
+        if self._unsynced and time.monotonic() - self._last_sync >= self.SYNC_INTERVAL:
+            self._sync_files()
+
+        # After midnight, yesterday's files will not be written again
+        if self._open_date != self._log_date:
+            stale = self._open_date
+            self._open_date = self._log_date
+            if stale:
+                self._close_files()
+                return
+        self._close_idle_files()
+
+    def _sync_files(self) -> None:
+        """Sync files written since the last sync to disk. Called on the writer thread."""
+        for log_file in self._unsynced:
+            fd = self._fds.get(log_file)
+            if fd is None:
+                continue
+            try:
+                _fdatasync(fd)
+            except OSError as e:
+                self._report_error(f"Failed to sync log file {log_file}: {e}")
+        self._unsynced.clear()
+        self._last_sync = time.monotonic()
+
+    def _close_files(self) -> None:
+        """Flush all buffers and close open log files. Called on the writer thread."""
+        self._flush_buffers()
+        if self._unsynced:
+            self._sync_files()
+        self._buffers.clear()
+        self._buffered_bytes.clear()
+        for log_file in list(self._fds):
+            self._close_file(log_file)
+
+    def _wait_for_writer(self, request: Optional[threading.Event]) -> None:
+        """
+        Hand a flush (Event) or stop (None) request to the writer and wait
+
+        Args:
+            request: Event to flush, or None to flush, close files and stop
+        """
+        writer = self._writer
+        if writer is None:
+            # Lines queued after a cleanup still need a writer to flush them
+            if request is None or self._queue.empty():
+                return
+            self._start_writer()
+            writer = self._writer
+        if writer is None:
+            return
+        if writer is threading.current_thread():
+            self._flush_buffers()
+            return
+
+        self._queue.put(request)
+        if request is None:
+            writer.join(self.WRITER_TIMEOUT)
+        else:
+            request.wait(self.WRITER_TIMEOUT)
+
+    def flush_all(self) -> None:
+        """Write every queued and buffered log line to disk."""
+        self._wait_for_writer(threading.Event())
+
+    def cleanup(self) -> None:
+        """Flush pending lines, stop the writer thread and close log files."""
+        self._wait_for_writer(None)
+        # Nothing left to flush at exit; also lets the manager be freed
+        atexit.unregister(self.flush_all)
+
+    def _now_ts(self) -> str:
+        """
+        Get the current "[HH:MM:SS]" log timestamp
+
+        The formatted string is reused for every line logged within the same
+        second.
+
+        Returns:
+            Timestamp string
+        """
+        now = int(time.time())
+        cached = self._ts_cache
+        if cached[0] == now:
+            return cached[1]
+        timestamp = time.strftime("[%H:%M:%S]", time.localtime(now))
+        self._ts_cache = (now, timestamp)
+        return timestamp
+
+    def _emit(self, kind: str, server: str, target: str, *fields: str) -> None:
+        """
+        Format a log line from its template and queue it
+
+        Args:
+            kind: Key into _TEMPLATES
+            server: Server name
+            target: Channel or PM target
+            *fields: Values for the template after the timestamp
+        """
+        if not self.enabled:
+            return
+        self._write_to_log(server, target, self._TEMPLATES[kind] % (self._now_ts(), *fields))
+
+    def _emit_multi(self, kind: str, server: str, targets: Sequence[str], *fields: str) -> None:
+        """
+        Format a log line once and queue it for several targets
+
+        Args:
+            kind: Key into _TEMPLATES
+            server: Server name
+            targets: Channels or PM targets
+            *fields: Values for the template after the timestamp
+        """
+        if not self.enabled or not targets:
+            return
+        self._write_to_logs(server, targets, self._TEMPLATES[kind] % (self._now_ts(), *fields))
 
     def log_message(self, server: str, target: str, sender: str, message: str) -> None:
         """
@@ -172,9 +674,7 @@ class LogManager:
             sender: Message sender
             message: Message text
         """
-        timestamp = datetime.now().strftime("[%H:%M:%S]")
-        line = f"{timestamp} <{sender}> {message}"
-        self._write_to_log(server, target, line)
+        self._emit("message", server, target, sender, message)
 
     def log_action(self, server: str, target: str, sender: str, action: str) -> None:
         """
@@ -186,9 +686,7 @@ class LogManager:
             sender: Action sender
             action: Action text
         """
-        timestamp = datetime.now().strftime("[%H:%M:%S]")
-        line = f"{timestamp} * {sender} {action}"
-        self._write_to_log(server, target, line)
+        self._emit("action", server, target, sender, action)
 
     def log_notice(self, server: str, target: str, sender: str, message: str) -> None:
         """
@@ -200,9 +698,7 @@ class LogManager:
             sender: Notice sender
             message: Notice text
         """
-        timestamp = datetime.now().strftime("[%H:%M:%S]")
-        line = f"{timestamp} -{sender}- {message}"
-        self._write_to_log(server, target, line)
+        self._emit("notice", server, target, sender, message)
 
     def log_join(self, server: str, channel: str, nick: str) -> None:
         """
@@ -213,9 +709,7 @@ class LogManager:
             channel: Channel name
             nick: User nickname
         """
-        timestamp = datetime.now().strftime("[%H:%M:%S]")
-        line = f"{timestamp} --> {nick} has joined {channel}"
-        self._write_to_log(server, channel, line)
+        self._emit("join", server, channel, nick, channel)
 
     def log_part(self, server: str, channel: str, nick: str, reason: str = "") -> None:
         """
@@ -227,12 +721,7 @@ class LogManager:
             nick: User nickname
             reason: Part reason (optional)
         """
-        timestamp = datetime.now().strftime("[%H:%M:%S]")
-        if reason:
-            line = f"{timestamp} <-- {nick} has left {channel} ({reason})"
-        else:
-            line = f"{timestamp} <-- {nick} has left {channel}"
-        self._write_to_log(server, channel, line)
+        self._emit("part", server, channel, nick, channel, f" ({reason})" if reason else "")
 
     def log_quit(self, server: str, channel: str, nick: str, reason: str = "") -> None:
         """
@@ -244,12 +733,19 @@ class LogManager:
             nick: User nickname
             reason: Quit reason (optional)
         """
-        timestamp = datetime.now().strftime("[%H:%M:%S]")
-        if reason:
-            line = f"{timestamp} <-- {nick} has quit ({reason})"
-        else:
-            line = f"{timestamp} <-- {nick} has quit"
-        self._write_to_log(server, channel, line)
+        self._emit("quit", server, channel, nick, f" ({reason})" if reason else "")
+
+    def log_quit_multi(self, server: str, channels: Sequence[str], nick: str, reason: str = "") -> None:
+        """
+        Log a user quit in every channel where it is visible
+
+        Args:
+            server: Server name
+            channels: Channels the user was in
+            nick: User nickname
+            reason: Quit reason (optional)
+        """
+        self._emit_multi("quit", server, channels, nick, f" ({reason})" if reason else "")
 
     def log_nick(self, server: str, channel: str, old_nick: str, new_nick: str) -> None:
         """
@@ -261,9 +757,19 @@ class LogManager:
             old_nick: Old nickname
             new_nick: New nickname
         """
-        timestamp = datetime.now().strftime("[%H:%M:%S]")
-        line = f"{timestamp} --- {old_nick} is now known as {new_nick}"
-        self._write_to_log(server, channel, line)
+        self._emit("nick", server, channel, old_nick, new_nick)
+
+    def log_nick_multi(self, server: str, channels: Sequence[str], old_nick: str, new_nick: str) -> None:
+        """
+        Log a nick change in every channel where it is visible
+
+        Args:
+            server: Server name
+            channels: Channels the user is in
+            old_nick: Old nickname
+            new_nick: New nickname
+        """
+        self._emit_multi("nick", server, channels, old_nick, new_nick)
 
     def log_kick(self, server: str, channel: str, kicker: str, kicked: str, reason: str = "") -> None:
         """
@@ -276,12 +782,7 @@ class LogManager:
             kicked: User who was kicked
             reason: Kick reason (optional)
         """
-        timestamp = datetime.now().strftime("[%H:%M:%S]")
-        if reason:
-            line = f"{timestamp} <-! {kicked} was kicked by {kicker} ({reason})"
-        else:
-            line = f"{timestamp} <-! {kicked} was kicked by {kicker}"
-        self._write_to_log(server, channel, line)
+        self._emit("kick", server, channel, kicked, kicker, f" ({reason})" if reason else "")
 
     def log_system(self, server: str, target: str, message: str) -> None:
         """
@@ -292,6 +793,4 @@ class LogManager:
             target: Channel or server
             message: System message
         """
-        timestamp = datetime.now().strftime("[%H:%M:%S]")
-        line = f"{timestamp} * {message}"
-        self._write_to_log(server, target, line)
+        self._emit("system", server, target, message)
@@ -6,9 +6,12 @@ Handles plugin discovery, loading, and hook execution.
 
 import os
 import sys
+import functools
+import threading
 import importlib.util
+from collections import deque
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, NamedTuple, Sequence, Tuple
 from gi.repository import GLib
 
 try:
@@ -19,6 +22,21 @@ except ImportError:
     print("Warning: pluggy not available. Plugin support will be disabled.")
 
 from .plugin_specs import AccessIRCHookSpec, hookimpl
+from .rate_limit import print_rate_limited
+
+
+@functools.lru_cache(maxsize=256)
+def _split_config_key(key: str) -> tuple:
+    """Split a dotted config key into its parts (plugins reuse a few keys)."""
+    return tuple(key.split('.'))
+
+
+class LoadedPlugin(NamedTuple):
+    """A registered plugin: its module, pluggy instance and source file."""
+
+    module: Any
+    instance: Any
+    file: Path
 
 
 class PluginContext:
@@ -28,10 +46,50 @@ class PluginContext:
     This is the main interface plugins use to interact with Access IRC.
     """
 
+    __slots__ = ("_pm", "_timers", "_pending_ops", "_ops_lock", "_flush_scheduled")
+
     def __init__(self, plugin_manager: 'PluginManager'):
         self._pm = plugin_manager
         self._timers: Dict[str, int] = {}  # timer_id -> GLib source id
 
+        # Operations waiting to run on the GTK main thread; one idle source
+        # drains everything queued so far
+        self._pending_ops: deque = deque()
+        self._ops_lock = threading.Lock()
+        self._flush_scheduled = False
+
+    def _enqueue(self, op: Callable[..., None], *args) -> None:
+        """Run op(*args) on the GTK main thread, batched with other pending operations.
+
+        Args:
+            op: Function to call
+            *args: Arguments to pass to op
+        """
+        with self._ops_lock:
+            self._pending_ops.append((op, args))
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        GLib.idle_add(self._flush_pending_ops)
+
+    def _flush_pending_ops(self) -> bool:
+        """Run all queued operations (runs on the GTK main thread).
+
+        Returns:
+            False (to remove the idle source)
+        """
+        with self._ops_lock:
+            pending = self._pending_ops
+            self._pending_ops = deque()
+            self._flush_scheduled = False
+
+        for op, args in pending:
+            try:
+                op(*args)
+            except Exception as e:
+                self._pm._report_plugin_error("operation", e)
+        return False
+
     # =========================================================================
     # IRC Operations
     # =========================================================================
@@ -47,22 +105,23 @@ class PluginContext:
         Returns:
             True if sent successfully
         """
-        if not self._pm.irc_manager:
+        irc = self._pm.irc_manager
+        if not irc:
             return False
-
-        def do_send():
-            sent_chunks = self._pm.irc_manager.send_message(server, target, message)
-            # Show in our own view
-            if self._pm.window and sent_chunks:
-                connection = self._pm.irc_manager.connections.get(server)
-                our_nick = connection.nickname if connection else "You"
-                for chunk in sent_chunks:
-                    self._pm.window.add_message(server, target, our_nick, chunk)
-            return False
-
-        GLib.idle_add(do_send)
+        self._enqueue(self._do_send_message, irc, server, target, message)
         return True
 
+    def _do_send_message(self, irc, server: str, target: str, message: str) -> None:
+        """Send a message and echo it in our own view (main thread)."""
+        sent_chunks = irc.send_message(server, target, message)
+        # Show in our own view
+        window = self._pm.window
+        if window and sent_chunks:
+            connection = irc.connections.get(server)
+            our_nick = connection.nickname if connection else "You"
+            for chunk in sent_chunks:
+                window.add_message(server, target, our_nick, chunk)
+
     def send_action(self, server: str, target: str, action: str) -> bool:
         """Send a CTCP ACTION (/me) to a channel or user.
 
@@ -74,21 +133,22 @@ class PluginContext:
         Returns:
             True if sent successfully
         """
-        if not self._pm.irc_manager:
-            return False
-
-        def do_send():
-            sent_chunks = self._pm.irc_manager.send_action(server, target, action)
-            if self._pm.window and sent_chunks:
-                connection = self._pm.irc_manager.connections.get(server)
-                our_nick = connection.nickname if connection else "You"
-                for chunk in sent_chunks:
-                    self._pm.window.add_action_message(server, target, our_nick, chunk)
+        irc = self._pm.irc_manager
+        if not irc:
             return False
-
-        GLib.idle_add(do_send)
+        self._enqueue(self._do_send_action, irc, server, target, action)
         return True
 
+    def _do_send_action(self, irc, server: str, target: str, action: str) -> None:
+        """Send an action and echo it in our own view (main thread)."""
+        sent_chunks = irc.send_action(server, target, action)
+        window = self._pm.window
+        if window and sent_chunks:
+            connection = irc.connections.get(server)
+            our_nick = connection.nickname if connection else "You"
+            for chunk in sent_chunks:
+                window.add_action_message(server, target, our_nick, chunk)
+
     def send_notice(self, server: str, target: str, message: str) -> bool:
         """Send a NOTICE to a channel or user.
 
@@ -100,16 +160,10 @@ class PluginContext:
         Returns:
             True if sent successfully
         """
-        if not self._pm.irc_manager:
-            return False
-
-        def do_send():
-            connection = self._pm.irc_manager.connections.get(server)
-            if connection and connection.irc:
-                connection.irc.quote(f"NOTICE {target} :{message}")
+        irc = self._pm.irc_manager
+        if not irc:
             return False
-
-        GLib.idle_add(do_send)
+        self._enqueue(self._do_send_raw, irc, server, f"NOTICE {target} :{message}")
         return True
 
     def send_raw(self, server: str, command: str) -> bool:
@@ -122,18 +176,19 @@ class PluginContext:
         Returns:
             True if sent successfully
         """
-        if not self._pm.irc_manager:
-            return False
-
-        def do_send():
-            connection = self._pm.irc_manager.connections.get(server)
-            if connection and connection.irc:
-                connection.irc.quote(command)
+        irc = self._pm.irc_manager
+        if not irc:
             return False
-
-        GLib.idle_add(do_send)
+        self._enqueue(self._do_send_raw, irc, server, command)
         return True
 
+    @staticmethod
+    def _do_send_raw(irc, server: str, line: str) -> None:
+        """Send a raw line if the server is connected (main thread)."""
+        connection = irc.connections.get(server)
+        if connection and connection.irc:
+            connection.irc.quote(line)
+
     def join_channel(self, server: str, channel: str) -> bool:
         """Join a channel.
 
@@ -144,9 +199,10 @@ class PluginContext:
         Returns:
             True if command sent
         """
-        if not self._pm.irc_manager:
+        irc = self._pm.irc_manager
+        if not irc:
             return False
-        self._pm.irc_manager.join_channel(server, channel)
+        irc.join_channel(server, channel)
         return True
 
     def part_channel(self, server: str, channel: str, reason: str = "") -> bool:
@@ -160,9 +216,10 @@ class PluginContext:
         Returns:
             True if command sent
         """
-        if not self._pm.irc_manager:
+        irc = self._pm.irc_manager
+        if not irc:
             return False
-        self._pm.irc_manager.part_channel(server, channel, reason)
+        irc.part_channel(server, channel, reason)
         return True
 
     # =========================================================================
@@ -179,14 +236,11 @@ class PluginContext:
             message: Message to display
             announce: Whether to announce to screen reader
         """
-        if not self._pm.window:
+        window = self._pm.window
+        if not window:
             return
-
-        def do_add():
-            self._pm.window.add_system_message(server, target, message, announce)
-            return False
-
-        GLib.idle_add(do_add)
+        announce = announce and window.has_screen_reader
+        self._enqueue(window.add_system_message, server, target, message, announce)
 
     def announce(self, message: str) -> None:
         """Announce a message to the screen reader.
@@ -194,14 +248,11 @@ class PluginContext:
         Args:
             message: Message to announce
         """
-        if not self._pm.window:
+        window = self._pm.window
+        # Nothing to schedule when no screen reader can hear it
+        if not window or not window.has_screen_reader:
             return
-
-        def do_announce():
-            self._pm.window.announce_to_screen_reader(message)
-            return False
-
-        GLib.idle_add(do_announce)
+        self._enqueue(window.announce_to_screen_reader, message)
 
     def play_sound(self, sound_type: str) -> None:
         """Play a sound.
@@ -209,9 +260,10 @@ class PluginContext:
         Args:
             sound_type: One of 'message', 'mention', 'notice', 'join', 'part'
         """
-        if not self._pm.sound_manager:
+        sound = self._pm.sound_manager
+        if not sound:
             return
-        self._pm.sound_manager.play(sound_type)
+        sound.play(sound_type)
 
     # =========================================================================
     # Information Getters
@@ -219,14 +271,16 @@ class PluginContext:
 
     def get_current_server(self) -> Optional[str]:
         """Get the currently selected server name."""
-        if self._pm.window:
-            return self._pm.window.current_server
+        window = self._pm.window
+        if window:
+            return window.current_server
         return None
 
     def get_current_target(self) -> Optional[str]:
         """Get the currently selected channel or PM target."""
-        if self._pm.window:
-            return self._pm.window.current_target
+        window = self._pm.window
+        if window:
+            return window.current_target
         return None
 
     def get_nickname(self, server: str) -> Optional[str]:
@@ -238,36 +292,35 @@ class PluginContext:
         Returns:
             Our nickname or None if not connected
         """
-        if not self._pm.irc_manager:
+        irc = self._pm.irc_manager
+        if not irc:
             return None
-        connection = self._pm.irc_manager.connections.get(server)
+        connection = irc.connections.get(server)
         if connection:
             return connection.nickname
         return None
 
     def get_connected_servers(self) -> List[str]:
         """Get list of connected server names."""
-        if not self._pm.irc_manager:
+        irc = self._pm.irc_manager
+        if not irc:
             return []
-        with self._pm.irc_manager._connections_lock:
-            return [name for name, conn in self._pm.irc_manager.connections.items()
-                    if conn.connected]
+        return list(irc.get_connected_servers())
 
-    def get_channels(self, server: str) -> List[str]:
-        """Get list of channels we're in on a server.
+    def get_channels(self, server: str) -> Sequence[str]:
+        """Get the channels we're in on a server.
 
         Args:
             server: Server name
 
         Returns:
-            List of channel names
+            Tuple of channel names; it is replaced rather than modified on
+            join/part, so plugins can keep it without copying
         """
-        if not self._pm.irc_manager:
-            return []
-        connection = self._pm.irc_manager.connections.get(server)
-        if connection:
-            return list(connection.current_channels)
-        return []
+        irc = self._pm.irc_manager
+        if not irc:
+            return ()
+        return irc.get_channels(server)
 
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get a configuration value.
@@ -279,13 +332,13 @@ class PluginContext:
         Returns:
             Configuration value
         """
-        if not self._pm.config_manager:
+        config = self._pm.config_manager
+        if not config:
             return default
 
         # Support dot notation for nested keys
-        keys = key.split('.')
-        value = self._pm.config_manager.config
-        for k in keys:
+        value = config.config
+        for k in _split_config_key(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -314,7 +367,7 @@ class PluginContext:
             try:
                 return callback()
             except Exception as e:
-                print(f"Plugin timer error ({timer_id}): {e}")
+                self._pm._report_plugin_error(f"timer {timer_id}", e)
                 return False
 
         source_id = GLib.timeout_add(interval_ms, wrapper)
@@ -330,11 +383,11 @@ class PluginContext:
         Returns:
             True if timer was removed
         """
-        if timer_id not in self._timers:
+        source_id = self._timers.pop(timer_id, None)
+        if source_id is None:
             return False
 
-        GLib.source_remove(self._timers[timer_id])
-        del self._timers[timer_id]
+        GLib.source_remove(source_id)
         return True
 
     def add_timeout(self, delay_ms: int, callback: Callable[[], None]) -> None:
@@ -348,7 +401,7 @@ class PluginContext:
             try:
                 callback()
             except Exception as e:
-                print(f"Plugin timeout error: {e}")
+                self._pm._report_plugin_error("timeout", e)
             return False
 
         GLib.timeout_add(delay_ms, wrapper)
@@ -360,17 +413,35 @@ class PluginContext:
         self._timers.clear()
 
 
+class _ErrorGuard:
+    """Internal plugin holding PluginManager's error-catching hookwrappers."""
+
+
 class PluginManager:
     """
     Manages plugin discovery, loading, and hook execution.
     """
 
+    ERROR_REPORT_INTERVAL = 1.0  # Seconds between printed errors per hook
+
     def __init__(self):
         self.plugins_dir: Optional[Path] = None
-        self.loaded_plugins: Dict[str, Any] = {}
+        self.loaded_plugins: Dict[str, LoadedPlugin] = {}
         self.pm: Optional[pluggy.PluginManager] = None
         self.ctx: Optional[PluginContext] = None
 
+        # Where an error happened -> (time last printed, errors suppressed since)
+        self._error_reports: Dict[str, Tuple[float, int]] = {}
+
+        # Hooks implemented by at least one loaded plugin, resolved once per
+        # (un)registration instead of per event: hook name -> tuple of
+        # (function, argnames) in pluggy's call order
+        self._hook_impls: Dict[str, Tuple[Tuple[Callable, Tuple[str, ...]], ...]] = {}
+        # Hooks that stop at the first non-None result
+        self._firstresult_hooks: frozenset = frozenset()
+        # Hooks where a plugin added its own wrapper; pluggy dispatches these
+        self._hook_callers: Dict[str, Any] = {}
+
         # References to application components (set via set_managers)
         self.irc_manager = None
         self.config_manager = None
@@ -381,6 +452,11 @@ class PluginManager:
         if PLUGGY_AVAILABLE:
             self.pm = pluggy.PluginManager("access_irc")
             self.pm.add_hookspecs(AccessIRCHookSpec)
+            self.pm.register(self._make_error_guard(), name="_error_guard")
+            self._firstresult_hooks = frozenset(
+                name for name, caller in vars(self.pm.hook).items()
+                if caller.spec.opts.get("firstresult")
+            )
             self.ctx = PluginContext(self)
 
     def set_managers(self, irc_manager, config_manager, sound_manager, log_manager, window) -> None:
@@ -420,46 +496,140 @@ class PluginManager:
         self.plugins_dir.mkdir(parents=True, exist_ok=True)
 
         loaded = 0
-
-        # Load Python files from plugins directory
-        for plugin_file in self.plugins_dir.glob("*.py"):
-            if plugin_file.name.startswith("_"):
-                continue
-
+        for label, plugin_name, plugin_file in self._plugin_sources():
             try:
-                if self._load_plugin_file(plugin_file):
+                if self._load_plugin_file(plugin_file, plugin_name):
                     loaded += 1
             except Exception as e:
-                print(f"Error loading plugin {plugin_file.name}: {e}")
+                print(f"Error loading {label}: {e}")
 
-        # Load plugin packages (directories with __init__.py)
-        for plugin_dir in self.plugins_dir.iterdir():
-            if plugin_dir.is_dir() and (plugin_dir / "__init__.py").exists():
-                if plugin_dir.name.startswith("_"):
-                    continue
+        return loaded
+
+    def discover_and_load_plugins_async(self, on_done: Callable[[int], None]) -> None:
+        """Discover and load plugins without blocking the GTK main thread.
+
+        Plugin modules are imported on a background loader thread; creating
+        the plugin instances, registration with pluggy and on_done then run
+        on the main thread.
+
+        Args:
+            on_done: Called on the main thread with the number of plugins loaded
+        """
+        if not PLUGGY_AVAILABLE or not self.pm or not self.plugins_dir:
+            on_done(0)
+            return
+
+        # Create plugins directory if it doesn't exist
+        self.plugins_dir.mkdir(parents=True, exist_ok=True)
+
+        thread = threading.Thread(
+            target=self._import_plugins_in_background,
+            args=(on_done,),
+            name="plugin-loader",
+            daemon=True
+        )
+        thread.start()
 
+    def _import_plugins_in_background(self, on_done: Callable[[int], None]) -> None:
+        """Import every discovered plugin, then hand them to the main thread.
+
+        Args:
+            on_done: Callback passed through to _register_imported_plugins
+        """
+        imported = []
+        try:
+            for label, plugin_name, plugin_file in self._plugin_sources():
                 try:
-                    if self._load_plugin_package(plugin_dir):
-                        loaded += 1
+                    result = self._import_plugin(plugin_file, plugin_name)
                 except Exception as e:
-                    print(f"Error loading plugin package {plugin_dir.name}: {e}")
+                    print(f"Error loading {label}: {e}")
+                    continue
+                if result:
+                    imported.append((result, plugin_file))
+        except Exception as e:
+            print(f"Error scanning plugins directory {self.plugins_dir}: {e}")
+        finally:
+            # on_startup hooks wait on on_done
+            GLib.idle_add(self._register_imported_plugins, imported, on_done)
 
-        return loaded
+    def _register_imported_plugins(self, imported: list, on_done: Callable[[int], None]) -> bool:
+        """Set up and register plugins imported by the loader thread (runs on the main thread).
+
+        Args:
+            imported: List of ((name, module), plugin_file)
+            on_done: Called with the number of plugins registered
+
+        Returns:
+            False (to remove the idle source)
+        """
+        loaded = 0
+        for (plugin_name, module), plugin_file in imported:
+            if self._setup_plugin(plugin_name, module, plugin_file):
+                loaded += 1
+        on_done(loaded)
+        return False
+
+    def _plugin_sources(self) -> List[tuple]:
+        """List plugin entry points in the plugins directory.
+
+        Returns:
+            List of (label for error messages, plugin name, path to the .py
+            file to load); single-file plugins come before packages
+        """
+        files = []
+        packages = []
+
+        # One directory pass; scandir entries carry their type, so only
+        # packages need an extra stat to check for __init__.py
+        with os.scandir(self.plugins_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("_"):
+                    continue
+                if entry.is_dir():
+                    init_file = Path(entry.path, "__init__.py")
+                    if init_file.is_file():
+                        packages.append((f"plugin package {name}", name, init_file))
+                elif name.endswith(".py"):
+                    files.append((f"plugin {name}", name[:-3], Path(entry.path)))
 
-    def _load_plugin_file(self, plugin_file: Path) -> bool:
+        return files + packages
+
+    def _load_plugin_file(self, plugin_file: Path, plugin_name: Optional[str] = None) -> bool:
         """Load a single plugin file.
 
         Args:
-            plugin_file: Path to plugin .py file
+            plugin_file: Path to plugin .py file (a package's __init__.py)
+            plugin_name: Plugin name; defaults to the file's stem
 
         Returns:
             True if loaded successfully
         """
-        plugin_name = plugin_file.stem
+        imported = self._import_plugin(plugin_file, plugin_name)
+        if not imported:
+            return False
+        plugin_name, module = imported
+        return self._setup_plugin(plugin_name, module, plugin_file)
+
+    def _import_plugin(self, plugin_file: Path,
+                       plugin_name: Optional[str] = None) -> Optional[tuple]:
+        """Import a plugin file.
+
+        Only runs the module's top-level code, so it is safe to call off the
+        main thread; the plugin instance is created by _setup_plugin.
+
+        Args:
+            plugin_file: Path to plugin .py file (a package's __init__.py)
+            plugin_name: Plugin name; defaults to the file's stem
+
+        Returns:
+            (plugin name, module), or None on failure
+        """
+        plugin_name = plugin_name or plugin_file.stem
 
         if plugin_name in self.loaded_plugins:
             print(f"Plugin {plugin_name} already loaded")
-            return False
+            return None
 
         # Load the module
         spec = importlib.util.spec_from_file_location(
@@ -467,7 +637,7 @@ class PluginManager:
             plugin_file
         )
         if spec is None or spec.loader is None:
-            return False
+            return None
 
         module = importlib.util.module_from_spec(spec)
         sys.modules[spec.name] = module
@@ -477,8 +647,21 @@ class PluginManager:
         except Exception as e:
             print(f"Error executing plugin {plugin_name}: {e}")
             del sys.modules[spec.name]
-            return False
+            return None
+
+        return plugin_name, module
+
+    def _setup_plugin(self, plugin_name: str, module: Any, plugin_file: Path) -> bool:
+        """Create an imported plugin's instance and register it (main thread only).
+
+        Args:
+            plugin_name: Plugin name
+            module: Module returned by _import_plugin
+            plugin_file: Path the plugin was loaded from
 
+        Returns:
+            True if registered
+        """
         # Look for plugin class or register hooks directly from module
         plugin_instance = None
 
@@ -488,7 +671,7 @@ class PluginManager:
                 plugin_instance = module.Plugin()
             except Exception as e:
                 print(f"Error instantiating Plugin class in {plugin_name}: {e}")
-                del sys.modules[spec.name]
+                sys.modules.pop(module.__name__, None)
                 return False
         # Check for a setup function that returns a plugin instance
         elif hasattr(module, 'setup'):
@@ -496,34 +679,38 @@ class PluginManager:
                 plugin_instance = module.setup(self.ctx)
             except Exception as e:
                 print(f"Error in setup() for {plugin_name}: {e}")
-                del sys.modules[spec.name]
+                sys.modules.pop(module.__name__, None)
                 return False
         else:
             # Use the module itself as a plugin (for simple scripts)
             plugin_instance = module
 
-        # Register with pluggy
-        self.pm.register(plugin_instance, name=plugin_name)
-        self.loaded_plugins[plugin_name] = {
-            'module': module,
-            'instance': plugin_instance,
-            'file': plugin_file
-        }
+        return self._register_plugin(plugin_name, module, plugin_instance, plugin_file)
 
-        print(f"Loaded plugin: {plugin_name}")
-        return True
-
-    def _load_plugin_package(self, plugin_dir: Path) -> bool:
-        """Load a plugin package (directory).
+    def _register_plugin(self, plugin_name: str, module: Any, plugin_instance: Any,
+                         plugin_file: Path) -> bool:
+        """Register an imported plugin with pluggy (main thread only).
 
         Args:
-            plugin_dir: Path to plugin directory
+            plugin_name: Plugin name
+            module: Plugin module
+            plugin_instance: Object carrying the plugin's hookimpls
+            plugin_file: Path the plugin was loaded from
 
         Returns:
-            True if loaded successfully
+            True if registered
         """
-        plugin_name = plugin_dir.name
-        return self._load_plugin_file(plugin_dir / "__init__.py")
+        if plugin_name in self.loaded_plugins:
+            print(f"Plugin {plugin_name} already loaded")
+            return False
+
+        # Register with pluggy
+        self.pm.register(plugin_instance, name=plugin_name)
+        self._refresh_hooks()
+        self.loaded_plugins[plugin_name] = LoadedPlugin(module, plugin_instance, plugin_file)
+
+        print(f"Loaded plugin: {plugin_name}")
+        return True
 
     def unload_plugin(self, plugin_name: str) -> bool:
         """Unload a plugin.
@@ -540,10 +727,9 @@ class PluginManager:
         if plugin_name not in self.loaded_plugins:
             return False
 
-        plugin_info = self.loaded_plugins[plugin_name]
-
         # Unregister from pluggy
         self.pm.unregister(name=plugin_name)
+        self._refresh_hooks()
 
         # Remove from sys.modules
         module_name = f"access_irc_plugin_{plugin_name}"
@@ -566,9 +752,9 @@ class PluginManager:
         if plugin_name not in self.loaded_plugins:
             return False
 
-        plugin_file = self.loaded_plugins[plugin_name]['file']
+        plugin_file = self.loaded_plugins[plugin_name].file
         self.unload_plugin(plugin_name)
-        return self._load_plugin_file(plugin_file)
+        return self._load_plugin_file(plugin_file, plugin_name)
 
     def get_loaded_plugins(self) -> List[str]:
         """Get list of loaded plugin names."""
@@ -578,40 +764,133 @@ class PluginManager:
     # Hook Callers
     # =========================================================================
 
-    def call_startup(self) -> None:
-        """Call on_startup hooks."""
-        if self.pm and self.ctx:
+    def _make_error_guard(self) -> Any:
+        """Build a plugin object wrapping every hook to catch plugin errors.
+
+        Only hooks that plugins wrap themselves are dispatched through pluggy
+        (see _refresh_hooks). For those, the guard's wrappers run outermost
+        (tryfirst) and turn an exception raised by any implementation into a
+        reported error and a None result.
+
+        Returns:
+            Object with one hookwrapper per hook spec
+        """
+        def guard_for(hook_name: str):
+            @hookimpl(hookwrapper=True, tryfirst=True)
+            def guard():
+                outcome = yield
+                if outcome.excinfo is not None:
+                    self._report_plugin_error(hook_name, outcome.excinfo[1])
+                    outcome.force_result(None)
+            return guard
+
+        # A plain class instance: pluggy before 1.1 keys plugins by hash
+        error_guard = _ErrorGuard()
+        for name in vars(self.pm.hook):
+            setattr(error_guard, name, guard_for(name))
+        return error_guard
+
+    def _refresh_hooks(self) -> None:
+        """Rebuild the per-hook call lists after (un)registering a plugin.
+
+        Each implemented hook gets a tuple of its plugin functions in the
+        order pluggy would call them (last registered first, honouring
+        tryfirst/trylast), so _invoke can loop over plain callables instead
+        of going through pluggy's generic dispatcher on every IRC line.
+        Hooks that a plugin wraps (hookwrapper=True or wrapper=True) keep
+        their pluggy hook caller so the wrapper still runs.
+        """
+        hook_impls = {}
+        hook_callers = {}
+        for name, caller in vars(self.pm.hook).items():
+            impls = caller.get_hookimpls()
+            # pluggy calls implementations from the end of this list
+            # HookImpl.wrapper (new-style wrappers) only exists in pluggy 1.1+
+            plain = [impl for impl in reversed(impls)
+                     if not impl.hookwrapper and not getattr(impl, "wrapper", False)]
+            if not plain:
+                continue
+            if len(plain) + 1 < len(impls):
+                # A plugin wrapper besides the error guard's own
+                hook_callers[name] = caller
+            else:
+                hook_impls[name] = tuple((impl.function, impl.argnames) for impl in plain)
+        self._hook_impls = hook_impls
+        self._hook_callers = hook_callers
+
+    def _report_plugin_error(self, where: str, error: Exception) -> None:
+        """Print a plugin error, at most once per interval for each hook/timer.
+
+        A plugin that fails on every IRC line would otherwise print once per
+        line on the main thread. Repeats are counted and the count is shown
+        with the next error that gets through.
+
+        Args:
+            where: Hook name, or description of the timer/operation that failed
+            error: The exception raised by the plugin
+        """
+        print_rate_limited(self._error_reports, where,
+                           f"Plugin error in {where}: {error}",
+                           self.ERROR_REPORT_INTERVAL)
+
+    def _invoke(self, hook_name: str, **kwargs) -> Any:
+        """Call a plugin hook, reporting (not raising) plugin errors.
+
+        A plugin that raises is reported and skipped; the remaining plugins
+        still run.
+
+        Args:
+            hook_name: Name of the hook in AccessIRCHookSpec
+            **kwargs: Hook arguments other than ctx
+
+        Returns:
+            For firstresult hooks, the first non-None result or None. For
+            other hooks, the list of non-None results (None if no plugin
+            implements the hook).
+        """
+        impls = self._hook_impls.get(hook_name)
+        if impls is None:
+            # Most events have no plugin listening; skip the call entirely.
+            # Hooks with plugin wrappers go through pluggy and its error guard.
+            caller = self._hook_callers.get(hook_name)
+            if caller is None or not self.ctx:
+                return None
+            return caller(ctx=self.ctx, **kwargs)
+
+        kwargs["ctx"] = self.ctx
+        firstresult = hook_name in self._firstresult_hooks
+        results = []
+        for function, argnames in impls:
             try:
-                self.pm.hook.on_startup(ctx=self.ctx)
+                result = function(*[kwargs[name] for name in argnames])
             except Exception as e:
-                print(f"Plugin error in on_startup: {e}")
+                self._report_plugin_error(hook_name, e)
+                continue
+            if result is not None:
+                if firstresult:
+                    return result
+                results.append(result)
+        return None if firstresult else results
+
+    def call_startup(self) -> None:
+        """Call on_startup hooks."""
+        self._invoke("on_startup")
 
     def call_shutdown(self) -> None:
         """Call on_shutdown hooks."""
         if self.pm and self.ctx:
-            try:
-                self.pm.hook.on_shutdown(ctx=self.ctx)
-            except Exception as e:
-                print(f"Plugin error in on_shutdown: {e}")
+            self._invoke("on_shutdown")
 
             # Clean up timers
             self.ctx._cleanup_timers()
 
     def call_connect(self, server: str) -> None:
         """Call on_connect hooks."""
-        if self.pm and self.ctx:
-            try:
-                self.pm.hook.on_connect(ctx=self.ctx, server=server)
-            except Exception as e:
-                print(f"Plugin error in on_connect: {e}")
+        self._invoke("on_connect", server=server)
 
     def call_disconnect(self, server: str) -> None:
         """Call on_disconnect hooks."""
-        if self.pm and self.ctx:
-            try:
-                self.pm.hook.on_disconnect(ctx=self.ctx, server=server)
-            except Exception as e:
-                print(f"Plugin error in on_disconnect: {e}")
+        self._invoke("on_disconnect", server=server)
 
     def filter_incoming_message(self, server: str, target: str, sender: str,
                                 message: str) -> Optional[Dict[str, Any]]:
@@ -620,144 +899,70 @@ class PluginManager:
         Returns:
             None to allow unchanged, or dict with modifications/block
         """
-        if self.pm and self.ctx:
-            try:
-                return self.pm.hook.filter_incoming_message(
-                    ctx=self.ctx, server=server, target=target,
-                    sender=sender, message=message
-                )
-            except Exception as e:
-                print(f"Plugin error in filter_incoming_message: {e}")
-        return None
+        return self._invoke("filter_incoming_message", server=server, target=target,
+                            sender=sender, message=message)
 
     def filter_incoming_action(self, server: str, target: str, sender: str,
                                action: str) -> Optional[Dict[str, Any]]:
         """Call filter_incoming_action hooks."""
-        if self.pm and self.ctx:
-            try:
-                return self.pm.hook.filter_incoming_action(
-                    ctx=self.ctx, server=server, target=target,
-                    sender=sender, action=action
-                )
-            except Exception as e:
-                print(f"Plugin error in filter_incoming_action: {e}")
-        return None
+        return self._invoke("filter_incoming_action", server=server, target=target,
+                            sender=sender, action=action)
 
     def filter_incoming_notice(self, server: str, target: str, sender: str,
                                message: str) -> Optional[Dict[str, Any]]:
         """Call filter_incoming_notice hooks."""
-        if self.pm and self.ctx:
-            try:
-                return self.pm.hook.filter_incoming_notice(
-                    ctx=self.ctx, server=server, target=target,
-                    sender=sender, message=message
-                )
-            except Exception as e:
-                print(f"Plugin error in filter_incoming_notice: {e}")
-        return None
+        return self._invoke("filter_incoming_notice", server=server, target=target,
+                            sender=sender, message=message)
 
     def filter_outgoing_message(self, server: str, target: str,
                                 message: str) -> Optional[Dict[str, Any]]:
         """Call filter_outgoing_message hooks."""
-        if self.pm and self.ctx:
-            try:
-                return self.pm.hook.filter_outgoing_message(
-                    ctx=self.ctx, server=server, target=target, message=message
-                )
-            except Exception as e:
-                print(f"Plugin error in filter_outgoing_message: {e}")
-        return None
+        return self._invoke("filter_outgoing_message", server=server, target=target,
+                            message=message)
 
     def call_message(self, server: str, target: str, sender: str,
                      message: str, is_mention: bool) -> None:
         """Call on_message hooks."""
-        if self.pm and self.ctx:
-            try:
-                self.pm.hook.on_message(
-                    ctx=self.ctx, server=server, target=target,
-                    sender=sender, message=message, is_mention=is_mention
-                )
-            except Exception as e:
-                print(f"Plugin error in on_message: {e}")
+        self._invoke("on_message", server=server, target=target, sender=sender,
+                     message=message, is_mention=is_mention)
 
     def call_action(self, server: str, target: str, sender: str,
                     action: str, is_mention: bool) -> None:
         """Call on_action hooks."""
-        if self.pm and self.ctx:
-            try:
-                self.pm.hook.on_action(
-                    ctx=self.ctx, server=server, target=target,
-                    sender=sender, action=action, is_mention=is_mention
-                )
-            except Exception as e:
-                print(f"Plugin error in on_action: {e}")
+        self._invoke("on_action", server=server, target=target, sender=sender,
+                     action=action, is_mention=is_mention)
 
     def call_notice(self, server: str, target: str, sender: str, message: str) -> None:
         """Call on_notice hooks."""
-        if self.pm and self.ctx:
-            try:
-                self.pm.hook.on_notice(
-                    ctx=self.ctx, server=server, target=target,
-                    sender=sender, message=message
-                )
-            except Exception as e:
-                print(f"Plugin error in on_notice: {e}")
+        self._invoke("on_notice", server=server, target=target, sender=sender,
+                     message=message)
 
     def call_join(self, server: str, channel: str, nick: str) -> None:
         """Call on_join hooks."""
-        if self.pm and self.ctx:
-            try:
-                self.pm.hook.on_join(ctx=self.ctx, server=server,
-                                     channel=channel, nick=nick)
-            except Exception as e:
-                print(f"Plugin error in on_join: {e}")
+        self._invoke("on_join", server=server, channel=channel, nick=nick)
 
     def call_part(self, server: str, channel: str, nick: str, reason: str) -> None:
         """Call on_part hooks."""
-        if self.pm and self.ctx:
-            try:
-                self.pm.hook.on_part(ctx=self.ctx, server=server,
-                                     channel=channel, nick=nick, reason=reason)
-            except Exception as e:
-                print(f"Plugin error in on_part: {e}")
+        self._invoke("on_part", server=server, channel=channel, nick=nick, reason=reason)
 
     def call_quit(self, server: str, nick: str, reason: str) -> None:
         """Call on_quit hooks."""
-        if self.pm and self.ctx:
-            try:
-                self.pm.hook.on_quit(ctx=self.ctx, server=server,
-                                     nick=nick, reason=reason)
-            except Exception as e:
-                print(f"Plugin error in on_quit: {e}")
+        self._invoke("on_quit", server=server, nick=nick, reason=reason)
 
     def call_nick(self, server: str, old_nick: str, new_nick: str) -> None:
         """Call on_nick hooks."""
-        if self.pm and self.ctx:
-            try:
-                self.pm.hook.on_nick(ctx=self.ctx, server=server,
-                                     old_nick=old_nick, new_nick=new_nick)
-            except Exception as e:
-                print(f"Plugin error in on_nick: {e}")
+        self._invoke("on_nick", server=server, old_nick=old_nick, new_nick=new_nick)
 
     def call_kick(self, server: str, channel: str, kicked: str,
                   kicker: str, reason: str) -> None:
         """Call on_kick hooks."""
-        if self.pm and self.ctx:
-            try:
-                self.pm.hook.on_kick(ctx=self.ctx, server=server, channel=channel,
-                                     kicked=kicked, kicker=kicker, reason=reason)
-            except Exception as e:
-                print(f"Plugin error in on_kick: {e}")
+        self._invoke("on_kick", server=server, channel=channel, kicked=kicked,
+                     kicker=kicker, reason=reason)
 
     def call_topic(self, server: str, channel: str, topic: str,
                    setter: Optional[str]) -> None:
         """Call on_topic hooks."""
-        if self.pm and self.ctx:
-            try:
-                self.pm.hook.on_topic(ctx=self.ctx, server=server,
-                                      channel=channel, topic=topic, setter=setter)
-            except Exception as e:
-                print(f"Plugin error in on_topic: {e}")
+        self._invoke("on_topic", server=server, channel=channel, topic=topic, setter=setter)
 
     def call_command(self, server: str, target: str, command: str, args: str) -> bool:
         """Call on_command hooks.
@@ -765,13 +970,5 @@ class PluginManager:
         Returns:
             True if a plugin handled the command
         """
-        if self.pm and self.ctx:
-            try:
-                result = self.pm.hook.on_command(
-                    ctx=self.ctx, server=server, target=target,
-                    command=command, args=args
-                )
-                return result is True
-            except Exception as e:
-                print(f"Plugin error in on_command: {e}")
-        return False
+        return self._invoke("on_command", server=server, target=target,
+                            command=command, args=args) is True
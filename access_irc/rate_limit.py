@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Rate-limited console output for Access IRC
+Keeps a repeating error from flooding the console
+"""
+
+import time
+from typing import Dict, Hashable, Tuple
+
+
+def print_rate_limited(reports: Dict[Hashable, Tuple[float, int]], key: Hashable,
+                       message: str, interval: float) -> None:
+    """
+    Print a message, at most once per interval for each key
+
+    Messages in between are counted instead of printed, and the count is
+    included in the next message for that key that gets through.
+
+    Args:
+        reports: Per-key (time last printed, messages suppressed since) state,
+            owned by the caller
+        key: What the message is about (a server, hook, ...)
+        message: Message to print
+        interval: Minimum seconds between printed messages for a key
+    """
+    now = time.monotonic()
+    last, suppressed = reports.get(key, (0.0, 0))
+    if last and now - last < interval:
+        reports[key] = (last, suppressed + 1)
+        return
+    reports[key] = (now, 0)
+    if suppressed:
+        print(f"{message} ({suppressed} suppressed)")
+    else:
+        print(message)
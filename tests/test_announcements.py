@@ -17,6 +17,12 @@ class FakeConnection:
         self.nickname = nickname
         self.channel_users = channel_users or {}
 
+    def channels_for_user(self, nickname):
+        return tuple(
+            channel for channel, users in self.channel_users.items()
+            if nickname in {user.lstrip("~&@%+") for user in users}
+        )
+
 
 def _make_app():
     """Create an AccessIRCApplication without calling __init__ (avoids GTK).
@@ -63,6 +63,16 @@ def test_apply_mode_changes_updates_prefixes():
     assert "+bob" not in users
 
 
+def test_parse_mode_changes_skips_non_user_params():
+    connection = _make_connection()
+
+    changes = connection._parse_mode_changes("+kov-l+b", ["secret", "alice", "bob", "*!*@spam"])
+    assert changes == [("+", "o", "alice"), ("+", "v", "bob")]
+
+    # Missing parameters stop parsing rather than misattributing nicks
+    assert connection._parse_mode_changes("+oo", ["alice"]) == [("+", "o", "alice")]
+
+
 def test_topic_requested_on_self_join(monkeypatch):
     connection = _make_connection()
     fake = FakeIRC()
@@ -148,3 +158,361 @@ def test_alternate_nick_not_used_when_connected():
 
     assert connection.nickname == "Primary"
     assert fake.quoted == []
+
+
+def test_auto_connect_commands_translate_slash_commands():
+    connection = _make_connection()
+    fake = FakeIRC()
+    connection.irc = fake
+
+    for command in ["/nick other", "/away", "/away brb", "/invite bob #chan",
+                    "/topic #chan new topic", "/raw PING x", "/unknown arg"]:
+        connection._send_auto_connect_command(command)
+
+    assert fake.quoted == [
+        "NICK other",
+        "AWAY",
+        "AWAY :brb",
+        "INVITE bob #chan",
+        "TOPIC #chan :new topic",
+        "PING x",
+        "unknown arg",
+    ]
+
+
+def test_get_channel_users_tracks_membership_changes():
+    connection = _make_connection()
+    for nick in ["carol", "@alice", "bob"]:
+        connection.add_user_to_channel("#chan", nick)
+
+    users = connection.get_channel_users("#chan")
+    assert users == ("@alice", "bob", "carol")
+    assert connection.get_channel_users("#chan") is users
+
+    connection.rename_user("bob", "zed")
+    connection.remove_user_from_channel("#chan", "carol")
+    connection._apply_mode_changes("#chan", "+v", ["zed"])
+    connection.add_user_to_channel("#chan", "dave")
+    assert users == ("@alice", "bob", "carol")
+    users = connection.get_channel_users("#chan")
+    assert list(users) == sorted(connection.channel_users["#chan"])
+    assert users == ("+zed", "@alice", "dave")
+
+    connection.clear_channel_users("#chan")
+    assert connection.get_channel_users("#chan") == ()
+
+
+def test_manager_read_caches_follow_connection_state(monkeypatch):
+    monkeypatch.setattr(
+        irc_manager.GLib,
+        "idle_add",
+        lambda func, *args, **kwargs: func(*args)
+    )
+    manager = irc_manager.IRCManager(None, {})
+    connection = _make_connection()
+    fake = FakeIRC()
+    connection.irc = fake
+    connection.nickname = "me"
+    connection._register_handlers()
+    manager.connections = {"TestNet": connection}
+    connection.on_connected_change = manager._on_connected_change
+
+    assert manager.get_connected_servers() == ()
+    assert not manager.is_connected("TestNet")
+    fake.handlers["001"](fake, ["server"], ["me"])
+    assert manager.is_connected("TestNet")
+    servers = manager.get_connected_servers()
+    assert servers == ("TestNet",)
+    assert manager.get_connected_servers() is servers
+
+    fake.handlers["JOIN"](fake, ["me"], ["#one"])
+    channels = manager.get_channels("TestNet")
+    assert channels == ("#one",)
+    assert manager.get_channels("TestNet") is channels
+
+    fake.handlers["PART"](fake, ["me"], ["#one"])
+    assert manager.get_channels("TestNet") == ()
+
+
+class FakeSocket:
+    def __init__(self, sndbuf):
+        self.sndbuf = sndbuf
+        self.options = {}
+
+    def setsockopt(self, level, option, value):
+        self.options[option] = value
+
+    def getsockopt(self, level, option):
+        return self.sndbuf
+
+
+def test_socket_is_tuned_again_after_reconnect(monkeypatch):
+    monkeypatch.setattr(
+        irc_manager.GLib,
+        "idle_add",
+        lambda func, *args, **kwargs: func(*args)
+    )
+    connection = _make_connection()
+    fake = FakeIRC()
+    connection.irc = fake
+    connection._register_handlers()
+
+    fake.sock = FakeSocket(sndbuf=4096)
+    fake.handlers["001"](fake, ["server"], ["me"])
+    assert fake.sock.options[irc_manager.socket.TCP_NODELAY] == 1
+    assert connection.send_queue.max_batch_bytes == 2048
+
+    # miniirc replaces the socket when it reconnects
+    fake.sock = FakeSocket(sndbuf=2048)
+    fake.handlers["001"](fake, ["server"], ["me"])
+    assert fake.sock.options[irc_manager.socket.TCP_NODELAY] == 1
+    assert connection.send_queue.max_batch_bytes == 1024
+
+
+def test_not_connected_notices_are_rate_limited(monkeypatch, capsys):
+    import access_irc.rate_limit as rate_limit_module
+
+    manager = irc_manager.IRCManager(None, {})
+    clock = [100.0]
+    monkeypatch.setattr(rate_limit_module.time, "monotonic", lambda: clock[0])
+
+    for _ in range(3):
+        assert manager.send_message("Missing", "#chan", "hello") == ()
+    clock[0] += manager.MISS_REPORT_INTERVAL
+    manager.send_ctcp("Missing", "nick", "VERSION")
+
+    assert capsys.readouterr().out.splitlines() == [
+        "Not connected to Missing",
+        "Not connected to Missing (2 suppressed)",
+    ]
+
+
+def test_reply_targets_connection_of_current_event(monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(
+        irc_manager.GLib,
+        "idle_add",
+        lambda func, *args, **kwargs: scheduled.append((func, args))
+    )
+    manager = irc_manager.IRCManager(None, {})
+    replies = []
+
+    def on_message(server, channel, sender, message, is_mention):
+        replies.append(manager.reply(channel, f"echo {message}"))
+
+    connection = irc_manager.IRCConnection(
+        {"name": "TestNet", "host": "irc.test", "channels": []},
+        {"on_message": on_message},
+    )
+    connection.irc = FakeIRC()
+    connection.connected = True
+
+    connection._enqueue_dispatch("on_message", "TestNet", "#chan", "alice", "hi", False)
+    func, args = scheduled[0]
+    func(*args)
+
+    assert replies == [["echo hi"]]
+    assert connection.irc.quoted == ["PRIVMSG #chan :echo hi"]
+    assert manager.reply("#chan", "outside") == ()
+
+
+def test_dispatched_events_share_one_idle_source(monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(
+        irc_manager.GLib,
+        "idle_add",
+        lambda func, *args, **kwargs: scheduled.append((func, args))
+    )
+    received = []
+    connection = irc_manager.IRCConnection(
+        {"name": "TestNet", "host": "irc.test", "channels": []},
+        {"on_join": lambda *args: received.append(("join",) + args),
+         "on_part": lambda *args: received.append(("part",) + args)},
+    )
+
+    connection._enqueue_dispatch("on_join", "TestNet", "#a", "alice")
+    connection._enqueue_dispatch("on_part", "TestNet", "#a", "bob", "")
+    assert len(scheduled) == 1
+
+    func, args = scheduled.pop()
+    assert func(*args) is False
+    assert received == [
+        ("join", "TestNet", "#a", "alice"),
+        ("part", "TestNet", "#a", "bob", ""),
+    ]
+
+    connection._enqueue_dispatch("on_join", "TestNet", "#b", "carol")
+    assert len(scheduled) == 1
+
+    scheduled.clear()
+    connection._enqueue_dispatch("on_quit", "TestNet", "dave", "", [])
+    assert scheduled == []
+
+
+def test_quit_removes_user_from_indexed_channels(monkeypatch):
+    monkeypatch.setattr(
+        irc_manager.GLib,
+        "idle_add",
+        lambda func, *args, **kwargs: func(*args)
+    )
+    quits = []
+    connection = irc_manager.IRCConnection(
+        {"name": "TestNet", "host": "irc.test", "channels": []},
+        {"on_quit": lambda *args: quits.append(args)},
+    )
+    fake = FakeIRC()
+    connection.irc = fake
+    connection._register_handlers()
+    connection.add_user_to_channel("#a", "@alice")
+    connection.add_user_to_channel("#b", "alice")
+    connection.add_user_to_channel("#c", "bob")
+
+    fake.handlers["QUIT"](fake, ["alice"], ["bye"])
+
+    server, nick, reason, channels = quits[0]
+    assert (server, nick, reason) == ("TestNet", "alice", "bye")
+    assert sorted(channels) == ["#a", "#b"]
+    assert connection.channel_users == {"#a": set(), "#b": set(), "#c": {"bob"}}
+    assert "alice" not in connection._user_channels
+
+
+def test_channels_for_user_ignores_mode_prefixes():
+    connection = _make_connection()
+    connection.add_user_to_channel("#a", "@alice")
+    connection.add_user_to_channel("#b", "bob")
+    connection.add_user_to_channel("#c", "alice")
+
+    assert connection.channels_for_user("alice") == ("#a", "#c")
+    assert connection.channels_for_user("carol") == ()
+
+
+def test_add_users_to_channel_matches_single_adds():
+    names = ["@alice", "bob", "+carol", "dave", "+bob", "alice"]
+    single = _make_connection()
+    for name in names:
+        single.add_user_to_channel("#chan", name)
+
+    bulk = _make_connection()
+    bulk.add_user_to_channel("#chan", "@dave")
+    bulk.get_channel_users("#chan")
+    bulk.add_users_to_channel("#chan", names)
+
+    assert bulk.channel_users == single.channel_users
+    assert bulk.get_channel_users("#chan") == single.get_channel_users("#chan")
+    assert bulk._user_channels == single._user_channels
+
+
+def test_ctcp_action_and_dcc_routing(monkeypatch):
+    monkeypatch.setattr(
+        irc_manager.GLib,
+        "idle_add",
+        lambda func, *args, **kwargs: func(*args)
+    )
+    events = []
+    connection = irc_manager.IRCConnection(
+        {"name": "TestNet", "host": "irc.test", "channels": []},
+        {
+            "on_action": lambda *args: events.append(("action",) + args),
+            "on_ctcp_dcc": lambda *args: events.append(("dcc",) + args),
+            "on_message": lambda *args: events.append(("message",) + args),
+        },
+    )
+    fake = FakeIRC()
+    connection.irc = fake
+    connection.nickname = "me"
+    connection._register_handlers()
+    privmsg = fake.handlers["PRIVMSG"]
+
+    privmsg(fake, ["alice"], ["#chan", "\x01ACTION waves at me\x01"])
+    privmsg(fake, ["alice"], ["me", "\x01dcc SEND file 1 2 3\x01"])
+    privmsg(fake, ["alice"], ["#chan", "hello"])
+
+    assert events == [
+        ("action", "TestNet", "#chan", "alice", "waves at me", True, False),
+        ("dcc", "TestNet", "alice", "dcc SEND file 1 2 3"),
+        ("message", "TestNet", "#chan", "alice", "hello", False, False),
+    ]
+
+
+def test_failed_background_connect_is_forgotten(monkeypatch):
+    import threading
+
+    attempted = threading.Event()
+    release = threading.Event()
+
+    def fake_connect(self):
+        attempted.set()
+        release.wait(2)
+        return False
+
+    monkeypatch.setattr(irc_manager.IRCConnection, "connect", fake_connect)
+    manager = irc_manager.IRCManager(None, {})
+    server = {"name": "TestNet", "host": "irc.test", "nickname": "me",
+              "realname": "Me", "alternate_nicks": []}
+
+    assert manager.connect_server(server) is True
+    assert attempted.wait(2)
+    assert "TestNet" in manager.connections
+    assert manager.connect_server(dict(server)) is False
+
+    release.set()
+    for _ in range(200):
+        if "TestNet" not in manager.connections:
+            break
+        threading.Event().wait(0.01)
+    assert "TestNet" not in manager.connections
+
+
+def test_disconnect_during_background_connect_drops_session(monkeypatch):
+    import threading
+
+    attempted = threading.Event()
+    release = threading.Event()
+    session_closed = threading.Event()
+
+    class FakeSession:
+        def disconnect(self):
+            session_closed.set()
+
+    def fake_connect(self):
+        attempted.set()
+        release.wait(2)
+        self.irc = FakeSession()
+        return True
+
+    monkeypatch.setattr(irc_manager.IRCConnection, "connect", fake_connect)
+    manager = irc_manager.IRCManager(None, {})
+    server = {"name": "TestNet", "host": "irc.test", "nickname": "me",
+              "realname": "Me", "alternate_nicks": []}
+
+    assert manager.connect_server(server) is True
+    assert attempted.wait(2)
+    manager.disconnect_server("TestNet")
+    assert "TestNet" not in manager.connections
+
+    release.set()
+    assert session_closed.wait(2)
+
+
+def test_names_fragments_produce_one_update_at_end_of_names(monkeypatch):
+    monkeypatch.setattr(
+        irc_manager.GLib,
+        "idle_add",
+        lambda func, *args, **kwargs: func(*args)
+    )
+    updates = []
+    connection = irc_manager.IRCConnection(
+        {"name": "TestNet", "host": "irc.test", "channels": []},
+        {"on_names": lambda *args: updates.append(args)},
+    )
+    fake = FakeIRC()
+    connection.irc = fake
+    connection.nickname = "me"
+    connection._register_handlers()
+
+    fake.handlers["353"](fake, ["server"], ["me", "=", "#chan", "@alice bob"])
+    fake.handlers["353"](fake, ["server"], ["me", "=", "#chan", "+carol me"])
+    assert updates == []
+
+    fake.handlers["366"](fake, ["server"], ["me", "#chan", "End of /NAMES list"])
+    assert updates == [("TestNet", "#chan", ("+carol", "@alice", "bob", "me"))]
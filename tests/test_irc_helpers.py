@@ -44,3 +44,104 @@ def test_split_message_handles_utf8_boundaries():
 
     assert all(len(chunk.encode("utf-8")) <= 5 for chunk in chunks)
     assert "".join(chunks) == message
+
+
+def test_split_message_prefers_word_boundaries():
+    connection = _connection()
+    message = "héllo wörld " * 10
+    chunks = connection._split_message(message, max_length=30)
+
+    assert all(len(chunk.encode("utf-8")) <= 30 for chunk in chunks)
+    assert all(not chunk.startswith(" ") for chunk in chunks)
+    assert " ".join(chunk.strip() for chunk in chunks) == message.strip()
+
+
+def test_batched_lines_are_sent_through_quote_in_order():
+    class QuotingIRC:
+        def __init__(self):
+            self.quoted = []
+
+        def quote(self, line):
+            self.quoted.append(line)
+
+    connection = _connection()
+    connection.irc = QuotingIRC()
+    connection._write_lines(["PRIVMSG #a :one", "PRIVMSG #a :two"])
+
+    assert connection.irc.quoted == ["PRIVMSG #a :one", "PRIVMSG #a :two"]
+
+
+def test_send_message_multi_groups_targets_into_shared_lines():
+    class RecordingQueue(list):
+        def schedule_flush(self):
+            return True
+
+    connection = _connection()
+    connection.irc = object()
+    connection.connected = True
+    connection.send_queue = RecordingQueue()
+
+    targets = ["#a", "#b", "#a", "#c", "#d", "#e"]
+    sent = connection.send_message_multi(targets, "hello")
+
+    assert list(connection.send_queue) == [
+        "PRIVMSG #a,#b,#c,#d :hello",
+        "PRIVMSG #e :hello",
+    ]
+    assert sent == {target: ["hello"] for target in ["#a", "#b", "#c", "#d", "#e"]}
+
+    connection.send_queue.clear()
+    long_message = "x" * connection._calculate_max_message_length("#a")
+    connection.send_message_multi(["#a", "#b"], long_message)
+    assert list(connection.send_queue) == [
+        f"PRIVMSG #a :{long_message}",
+        f"PRIVMSG #b :{long_message}",
+    ]
+
+
+def test_mentions_nick_follows_nickname_changes():
+    connection = _connection()
+    connection.nickname = "Alice"
+
+    assert connection._mentions_nick("hey alice!", "hey alice!")
+    assert connection._mentions_nick("hey \x02ali\x02ce", "hey alice")
+    assert not connection._mentions_nick("hi", "hi")
+
+    connection.nickname = "Bob"
+    assert not connection._mentions_nick("hey alice!", "hey alice!")
+    assert connection._mentions_nick("BOB: ping", "BOB: ping")
+
+
+def test_format_idle_uses_two_largest_units():
+    format_idle = irc_manager.IRCConnection._format_idle
+    assert format_idle(42) == "42s"
+    assert format_idle(125) == "2m"
+    assert format_idle(3 * 3600 + 5 * 60 + 9) == "3h 5m"
+    assert format_idle(2 * 86400 + 3 * 3600 + 59) == "2d 3h"
+
+
+def test_is_own_nick_uses_rfc1459_case_mapping():
+    connection = _connection()
+    connection.nickname = "Foo[away]"
+
+    assert connection._is_own_nick("Foo[away]")
+    assert connection._is_own_nick("foo{AWAY}")
+    assert not connection._is_own_nick("foo_away")
+
+    connection.nickname = "bar\\"
+    assert connection._is_own_nick("BAR|")
+    assert not connection._is_own_nick("Foo[away]")
+
+
+def test_failed_send_is_not_reported_as_sent():
+    class FailingIRC:
+        def quote(self, line):
+            raise OSError("connection lost")
+
+    connection = _connection()
+    connection.irc = FailingIRC()
+    connection.connected = True
+
+    assert connection.send_message("#a", "hello") == ()
+    assert connection.send_action("#a", "waves") == ()
+    assert connection.send_message_multi(["#a", "#b"], "hello") == {}
@@ -1,3 +1,6 @@
+import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -9,6 +12,7 @@ def test_log_write_creates_sanitized_paths(tmp_path):
     manager = LogManager(str(log_dir))
 
     manager.log_message("Bad/../Server", "#chan", "alice", "hello")
+    manager.flush_all()
 
     server_dirs = [p for p in log_dir.iterdir() if p.is_dir()]
     assert len(server_dirs) == 1
@@ -39,3 +43,315 @@ def test_logging_disabled_no_file(tmp_path):
     manager = LogManager(None)
     manager.log_message("Server", "#chan", "alice", "hello")
     assert not log_dir.exists()
+
+
+def test_log_lines_buffered_until_flush(tmp_path):
+    log_dir = tmp_path / "logs"
+    manager = LogManager(str(log_dir), flush_interval=3600)
+
+    manager.log_message("Server", "#chan", "alice", "one")
+    manager.log_message("Server", "#chan", "bob", "two")
+    log_file = Path(manager._get_log_file_path("Server", "#chan"))
+    assert not log_file.exists()
+
+    manager.flush_all()
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert [line.split(" ", 1)[1] for line in lines] == ["<alice> one", "<bob> two"]
+
+    manager.log_message("Server", "#chan", "carol", "three")
+    manager.cleanup()
+    assert log_file.read_text(encoding="utf-8").endswith("<carol> three\n")
+    assert manager._fds == {}
+
+
+def test_cleanup_removes_exit_flush_hook(tmp_path, monkeypatch):
+    import access_irc.log_manager as log_module
+
+    hooks = []
+    monkeypatch.setattr(log_module.atexit, "register", hooks.append)
+    monkeypatch.setattr(log_module.atexit, "unregister", hooks.remove)
+
+    manager = LogManager(str(tmp_path / "logs"), flush_interval=3600)
+    assert hooks == [manager.flush_all]
+    manager.cleanup()
+    assert hooks == []
+
+
+def test_full_buffer_written_immediately(tmp_path):
+    log_dir = tmp_path / "logs"
+    manager = LogManager(str(log_dir), buffer_size=64, flush_interval=3600)
+
+    manager.log_message("Server", "#chan", "alice", "x" * 80)
+
+    log_file = Path(manager._get_log_file_path("Server", "#chan"))
+    deadline = time.monotonic() + 2
+    while not log_file.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert ("x" * 80) in log_file.read_text(encoding="utf-8")
+    manager.cleanup()
+
+
+def test_logging_runs_on_writer_thread(tmp_path, monkeypatch):
+    log_dir = tmp_path / "logs"
+    manager = LogManager(str(log_dir), flush_interval=3600)
+    threads = []
+    real_buffer_line = manager._buffer_line
+
+    def record_thread(*args):
+        threads.append(threading.current_thread())
+        real_buffer_line(*args)
+
+    monkeypatch.setattr(manager, "_buffer_line", record_thread)
+    manager.log_message("Server", "#chan", "alice", "hi")
+    manager.cleanup()
+
+    assert threads and threads[0] is not threading.current_thread()
+    assert manager._writer is None
+    log_file = Path(manager._get_log_file_path("Server", "#chan"))
+    assert "<alice> hi" in log_file.read_text(encoding="utf-8")
+
+
+def test_log_file_path_cached_per_target(tmp_path):
+    log_dir = tmp_path / "logs"
+    manager = LogManager(str(log_dir))
+
+    path = manager._get_log_file_path("Server", "#chan")
+    assert manager._get_log_file_path("Server", "#chan") is path
+    assert manager._get_log_file_path("Server", "#other") != path
+
+    manager.set_log_directory(str(tmp_path / "moved"))
+    assert manager._get_log_file_path("Server", "#chan").startswith(str(tmp_path / "moved"))
+
+
+def test_sanitize_name_replaces_unsafe_characters():
+    assert LogManager._sanitize_name('a/b\\c:d*e?f"g<h>i|j') == "a-b-c-d-e-f-g-h-i-j"
+    assert LogManager._sanitize_name("#chan\x00/../x") == "#chan--x"
+
+
+def test_timestamp_reused_within_second(monkeypatch):
+    import access_irc.log_manager as log_module
+
+    manager = LogManager(None)
+    monkeypatch.setattr(log_module.time, "time", lambda: 1000.2)
+    first = manager._now_ts()
+    monkeypatch.setattr(log_module.time, "time", lambda: 1000.9)
+    assert manager._now_ts() is first
+    assert first == log_module.time.strftime("[%H:%M:%S]", log_module.time.localtime(1000))
+
+
+def test_write_chunks_finishes_partial_writev(tmp_path, monkeypatch):
+    import access_irc.log_manager as log_module
+
+    path = tmp_path / "out.log"
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT)
+    real_writev = os.writev
+    monkeypatch.setattr(log_module, "_HAVE_WRITEV", True)
+    monkeypatch.setattr(log_module.os, "writev", lambda f, bufs: real_writev(f, bufs[:1]))
+    try:
+        LogManager._write_chunks(fd, [b"one\n", b"two\n", b"three\n"])
+    finally:
+        os.close(fd)
+    assert path.read_bytes() == b"one\ntwo\nthree\n"
+
+
+def test_unencodable_text_is_replaced(tmp_path):
+    manager = LogManager(str(tmp_path / "logs"))
+    manager.log_message("Server", "#chan", "alice", "bad \ud800 char")
+    manager.log_message("Server", "#chan", "bob", "ok")
+    manager.cleanup()
+
+    log_file = Path(manager._get_log_file_path("Server", "#chan"))
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert lines[0].endswith("<alice> bad ? char")
+    assert lines[1].endswith("<bob> ok")
+
+
+def test_server_directory_created_once_and_recreated_if_removed(tmp_path, monkeypatch):
+    import shutil
+
+    log_dir = tmp_path / "logs"
+    manager = LogManager(str(log_dir))
+    calls = []
+    real_ensure = manager._ensure_directory_exists
+
+    def counting_ensure(directory):
+        calls.append(directory)
+        return real_ensure(directory)
+
+    monkeypatch.setattr(manager, "_ensure_directory_exists", counting_ensure)
+    manager._get_log_file_path("Server", "#one")
+    manager._get_log_file_path("Server", "#two")
+    assert calls == [str(log_dir / "Server")]
+
+    shutil.rmtree(log_dir / "Server")
+    manager.log_message("Server", "#one", "alice", "still here")
+    manager.cleanup()
+    assert "still here" in (log_dir / "Server").joinpath(
+        Path(manager._get_log_file_path("Server", "#one")).name
+    ).read_text(encoding="utf-8")
+
+
+def test_reason_suffix_only_when_given(tmp_path):
+    manager = LogManager(str(tmp_path / "logs"))
+    manager.log_part("Server", "#chan", "alice", "bye")
+    manager.log_part("Server", "#chan", "bob")
+    manager.log_quit("Server", "#chan", "carol", "Ping timeout")
+    manager.log_quit("Server", "#chan", "dave")
+    manager.log_kick("Server", "#chan", "op", "eve", "Spam")
+    manager.log_kick("Server", "#chan", "op", "frank")
+    manager.cleanup()
+
+    log_file = Path(manager._get_log_file_path("Server", "#chan"))
+    lines = [line.split(" ", 1)[1] for line in log_file.read_text(encoding="utf-8").splitlines()]
+    assert lines == [
+        "<-- alice has left #chan (bye)",
+        "<-- bob has left #chan",
+        "<-- carol has quit (Ping timeout)",
+        "<-- dave has quit",
+        "<-! eve was kicked by op (Spam)",
+        "<-! frank was kicked by op",
+    ]
+
+
+def test_templates_format_each_event(tmp_path):
+    manager = LogManager(str(tmp_path / "logs"))
+    manager.log_message("Server", "#chan", "alice", "100% sure")
+    manager.log_action("Server", "#chan", "bob", "waves")
+    manager.log_notice("Server", "#chan", "NickServ", "hi")
+    manager.log_join("Server", "#chan", "carol")
+    manager.log_nick("Server", "#chan", "carol", "carol_afk")
+    manager.log_system("Server", "#chan", "Topic changed")
+    manager.cleanup()
+
+    log_file = Path(manager._get_log_file_path("Server", "#chan"))
+    lines = [line.split(" ", 1)[1] for line in log_file.read_text(encoding="utf-8").splitlines()]
+    assert lines == [
+        "<alice> 100% sure",
+        "* bob waves",
+        "-NickServ- hi",
+        "--> carol has joined #chan",
+        "--- carol is now known as carol_afk",
+        "* Topic changed",
+    ]
+
+
+def test_log_files_roll_over_at_midnight(tmp_path, monkeypatch):
+    import access_irc.log_manager as log_module
+
+    manager = LogManager(str(tmp_path / "logs"), flush_interval=3600)
+    now = [time.mktime((2025, 11, 29, 23, 59, 58, 0, 0, -1))]
+    monkeypatch.setattr(log_module.time, "time", lambda: now[0])
+
+    manager.log_message("Server", "#chan", "alice", "late")
+    manager.flush_all()
+    assert manager._get_log_file_path("Server", "#chan").endswith("#chan-2025-11-29.log")
+    assert len(manager._fds) == 1
+
+    now[0] += 5
+    manager.log_message("Server", "#chan", "bob", "early")
+    manager.flush_all()
+    assert manager._get_log_file_path("Server", "#chan").endswith("#chan-2025-11-30.log")
+    assert len(manager._fds) == 0
+    manager.cleanup()
+
+    server_dir = tmp_path / "logs" / "Server"
+    assert "<alice> late" in (server_dir / "#chan-2025-11-29.log").read_text(encoding="utf-8")
+    assert "<bob> early" in (server_dir / "#chan-2025-11-30.log").read_text(encoding="utf-8")
+
+
+def test_errors_reported_at_most_once_per_interval(capsys, monkeypatch):
+    import access_irc.rate_limit as rate_limit_module
+
+    manager = LogManager(None)
+    now = [100.0]
+    monkeypatch.setattr(rate_limit_module.time, "monotonic", lambda: now[0])
+
+    for _ in range(5):
+        manager._report_error("Failed to write")
+    now[0] += manager.ERROR_REPORT_INTERVAL
+    manager._report_error("Failed again")
+
+    assert capsys.readouterr().out.splitlines() == [
+        "Failed to write",
+        "Failed again (4 suppressed)",
+    ]
+
+
+def test_idle_log_files_closed_on_flush(tmp_path):
+    manager = LogManager(str(tmp_path / "logs"), flush_interval=3600)
+    manager.log_message("Server", "#quiet", "alice", "hello")
+    manager.log_message("Server", "#busy", "bob", "hello")
+    manager.flush_all()
+    assert len(manager._fds) == 2
+
+    quiet = manager._get_log_file_path("Server", "#quiet")
+    manager._fd_used[quiet] -= manager.IDLE_FILE_TIMEOUT + 1
+    manager.flush_all()
+
+    assert list(manager._fds) == [manager._get_log_file_path("Server", "#busy")]
+    assert quiet not in manager._buffers
+    manager.cleanup()
+
+
+def test_durable_mode_syncs_written_files(tmp_path, monkeypatch):
+    import access_irc.log_manager as log_module
+
+    synced = []
+    monkeypatch.setattr(log_module, "_fdatasync", synced.append)
+
+    lazy = LogManager(str(tmp_path / "lazy"), flush_interval=3600)
+    lazy.log_message("Server", "#chan", "alice", "hi")
+    lazy.flush_all()
+    lazy.cleanup()
+    assert synced == []
+
+    durable = LogManager(str(tmp_path / "durable"), flush_interval=3600, durable=True)
+    durable.log_message("Server", "#chan", "alice", "hi")
+    durable.flush_all()
+    assert len(synced) == 1
+    durable.flush_all()  # Nothing new written, nothing to sync
+    assert len(synced) == 1
+    durable.cleanup()
+
+
+def test_buffer_size_follows_filesystem_block_size(tmp_path, monkeypatch):
+    import access_irc.log_manager as log_module
+
+    class FakeStat:
+        f_bsize = 65536
+
+    monkeypatch.setattr(log_module.os, "statvfs", lambda path: FakeStat, raising=False)
+    assert LogManager(str(tmp_path / "a")).buffer_size == 4 * 65536
+    assert LogManager(str(tmp_path / "b"), buffer_size=1024).buffer_size == 1024
+
+    FakeStat.f_bsize = 512
+    assert LogManager(str(tmp_path / "c")).buffer_size == LogManager.BUFFER_SIZE
+
+
+def test_multi_target_logging_shares_encoded_line(tmp_path, monkeypatch):
+    manager = LogManager(str(tmp_path / "logs"), flush_interval=3600)
+    monkeypatch.setattr(manager, "_start_writer", lambda: None)
+    manager.log_quit_multi("Server", ["#a", "#b"], "alice", "bye")
+    queued = [manager._queue.get_nowait() for _ in range(manager._queue.qsize())]
+
+    assert [item[1] for item in queued] == ["#a", "#b"]
+    assert queued[0][2] is queued[1][2]
+    assert queued[0][2].endswith(b"<-- alice has quit (bye)\n")
+
+
+def test_more_logs_than_open_file_cap(tmp_path):
+    manager = LogManager(str(tmp_path / "logs"), flush_interval=3600)
+    manager.MAX_OPEN_FILES = 2
+    targets = ["#a", "#b", "#c", "#d"]
+
+    for round_number in range(2):
+        for target in targets:
+            manager.log_message("Server", target, "alice", f"line {round_number}")
+        manager.flush_all()
+
+    assert manager._writer is not None and manager._writer.is_alive()
+    assert len(manager._fds) <= 2
+    for target in targets:
+        log_file = Path(manager._get_log_file_path("Server", target))
+        assert log_file.read_text(encoding="utf-8").count("<alice> line") == 2
+    manager.cleanup()
@@ -70,5 +70,332 @@ def test_plugin_discovery_and_hooks(tmp_path):
     # Ensure on_message works and does not raise on plugin errors
     manager.call_message("srv", "#chan", "alice", "hello", False)
 
-    seen = manager.loaded_plugins["setup_plugin"]["module"].seen
+    seen = manager.loaded_plugins["setup_plugin"].module.seen
     assert seen["last"] == ("srv", "#chan", "alice", "hello", False)
+
+
+class _FakeIrc:
+    def __init__(self):
+        self.quoted = []
+        self.connections = {"srv": self}
+        self.irc = self
+
+    def quote(self, line):
+        self.quoted.append(line)
+
+
+class _FakeWindow:
+    def __init__(self, has_screen_reader=True):
+        self.has_screen_reader = has_screen_reader
+        self.announced = []
+
+    def announce_to_screen_reader(self, message):
+        self.announced.append(message)
+
+
+def test_context_operations_share_one_idle_source(monkeypatch):
+    import access_irc.plugin_manager as plugin_module
+
+    scheduled = []
+    monkeypatch.setattr(plugin_module.GLib, "idle_add", scheduled.append)
+
+    manager = PluginManager()
+    manager.irc_manager = _FakeIrc()
+    manager.window = _FakeWindow()
+    ctx = manager.ctx
+
+    assert ctx.send_raw("srv", "PING a")
+    assert ctx.send_notice("srv", "bob", "hi")
+    ctx.announce("done")
+    assert len(scheduled) == 1
+
+    assert scheduled[0]() is False
+    assert manager.irc_manager.quoted == ["PING a", "NOTICE bob :hi"]
+    assert manager.window.announced == ["done"]
+
+    ctx.send_raw("srv", "PING b")
+    assert len(scheduled) == 2
+
+
+def test_hook_callers_report_plugin_errors(tmp_path, capsys):
+    _write_plugin(
+        tmp_path / "broken.py",
+        "\n".join([
+            "from access_irc.plugin_specs import hookimpl",
+            "",
+            "class Plugin:",
+            "    @hookimpl",
+            "    def filter_outgoing_message(self, ctx, server, target, message):",
+            "        raise ValueError('nope')",
+        ])
+    )
+    manager = PluginManager()
+    manager.plugins_dir = tmp_path
+    assert manager.discover_and_load_plugins() == 1
+
+    assert manager.filter_outgoing_message("srv", "#chan", "hi") is None
+    assert "Plugin error in filter_outgoing_message: nope" in capsys.readouterr().out
+    assert manager.call_command("srv", "#chan", "unknown", "") is False
+
+
+def test_hooks_without_implementations_are_skipped(tmp_path):
+    _write_plugin(
+        tmp_path / "joiner.py",
+        "\n".join([
+            "from access_irc.plugin_specs import hookimpl",
+            "",
+            "joins = []",
+            "",
+            "@hookimpl",
+            "def on_join(ctx, server, channel, nick):",
+            "    joins.append(nick)",
+        ])
+    )
+    manager = PluginManager()
+    manager.plugins_dir = tmp_path
+    manager.discover_and_load_plugins()
+    assert "on_join" in manager._hook_impls
+    assert "on_message" not in manager._hook_impls
+
+    manager.call_join("srv", "#chan", "alice")
+    assert manager.loaded_plugins["joiner"].module.joins == ["alice"]
+
+    manager.unload_plugin("joiner")
+    assert manager._hook_impls == {}
+
+
+def test_get_config_reads_current_values():
+    class _Config:
+        config = {"ui": {"announce_all_messages": False}}
+
+    manager = PluginManager()
+    manager.config_manager = _Config()
+    ctx = manager.ctx
+
+    assert ctx.get_config("ui.announce_all_messages") is False
+    _Config.config["ui"]["announce_all_messages"] = True
+    assert ctx.get_config("ui.announce_all_messages") is True
+    assert ctx.get_config("ui.missing.deeper", "dflt") == "dflt"
+
+
+def test_async_loading_sets_up_plugins_on_main_thread(tmp_path, monkeypatch):
+    import threading
+    import access_irc.plugin_manager as plugin_module
+
+    _write_plugin(
+        tmp_path / "greeter.py",
+        "\n".join([
+            "import threading",
+            "from access_irc.plugin_specs import hookimpl",
+            "",
+            "class Plugin:",
+            "    def __init__(self):",
+            "        self.built_on = threading.current_thread().name",
+            "",
+            "    @hookimpl",
+            "    def on_connect(self, ctx, server):",
+            "        pass",
+        ])
+    )
+    scheduled = []
+    monkeypatch.setattr(plugin_module.GLib, "idle_add",
+                        lambda func, *args: scheduled.append((func, args)))
+
+    manager = PluginManager()
+    manager.plugins_dir = tmp_path
+    results = []
+    manager.discover_and_load_plugins_async(results.append)
+
+    for thread in threading.enumerate():
+        if thread.name == "plugin-loader":
+            thread.join(5)
+    assert manager.loaded_plugins == {}
+    assert len(scheduled) == 1
+
+    func, args = scheduled[0]
+    assert func(*args) is False
+    assert results == [1]
+    plugin = manager.loaded_plugins["greeter"].instance
+    assert plugin.built_on == threading.current_thread().name
+    assert "on_connect" in manager._hook_impls
+
+
+def test_repeated_plugin_errors_are_rate_limited(capsys, monkeypatch):
+    import access_irc.rate_limit as rate_limit_module
+
+    now = [50.0]
+    monkeypatch.setattr(rate_limit_module.time, "monotonic", lambda: now[0])
+    manager = PluginManager()
+
+    for _ in range(3):
+        manager._report_plugin_error("on_message", RuntimeError("boom"))
+    manager._report_plugin_error("on_join", RuntimeError("other"))
+    now[0] += manager.ERROR_REPORT_INTERVAL
+    manager._report_plugin_error("on_message", RuntimeError("boom"))
+
+    assert capsys.readouterr().out.splitlines() == [
+        "Plugin error in on_message: boom",
+        "Plugin error in on_join: other",
+        "Plugin error in on_message: boom (2 suppressed)",
+    ]
+
+
+def test_timers_are_added_once_and_removed_once(monkeypatch):
+    import access_irc.plugin_manager as plugin_module
+
+    removed = []
+    monkeypatch.setattr(plugin_module.GLib, "timeout_add", lambda ms, func: 42)
+    monkeypatch.setattr(plugin_module.GLib, "source_remove", removed.append)
+    ctx = PluginManager().ctx
+
+    assert ctx.add_timer("tick", 100, lambda: True)
+    assert not ctx.add_timer("tick", 100, lambda: True)
+    assert ctx.remove_timer("tick")
+    assert not ctx.remove_timer("tick")
+    assert removed == [42]
+
+
+def test_discovery_names_packages_after_their_directory(tmp_path):
+    (tmp_path / "pkgplugin").mkdir()
+    _write_plugin(tmp_path / "pkgplugin" / "__init__.py", "loaded = True\n")
+    (tmp_path / "notaplugin").mkdir()
+    _write_plugin(tmp_path / "single.py", "loaded = True\n")
+    _write_plugin(tmp_path / "_private.py", "raise RuntimeError('skipped')\n")
+    _write_plugin(tmp_path / "readme.txt", "not python\n")
+
+    manager = PluginManager()
+    manager.plugins_dir = tmp_path
+
+    assert manager.discover_and_load_plugins() == 2
+    assert sorted(manager.loaded_plugins) == ["pkgplugin", "single"]
+
+
+def test_announce_skips_idle_dispatch_without_screen_reader(monkeypatch):
+    import access_irc.plugin_manager as plugin_module
+
+    scheduled = []
+    monkeypatch.setattr(plugin_module.GLib, "idle_add", scheduled.append)
+
+    manager = PluginManager()
+    manager.window = _FakeWindow(has_screen_reader=False)
+    manager.ctx.announce("unheard")
+
+    assert scheduled == []
+
+
+def test_failing_filter_does_not_stop_later_plugins(tmp_path, capsys):
+    _write_plugin(
+        tmp_path / "a_upper.py",
+        "\n".join([
+            "from access_irc.plugin_specs import hookimpl",
+            "",
+            "@hookimpl",
+            "def filter_outgoing_message(ctx, message):",
+            "    return {'message': message.upper()}",
+        ])
+    )
+    _write_plugin(
+        tmp_path / "b_broken.py",
+        "\n".join([
+            "from access_irc.plugin_specs import hookimpl",
+            "",
+            "@hookimpl(tryfirst=True)",
+            "def filter_outgoing_message(ctx, server, target, message):",
+            "    raise ValueError('nope')",
+        ])
+    )
+    manager = PluginManager()
+    manager.plugins_dir = tmp_path
+    assert manager.discover_and_load_plugins() == 2
+
+    assert manager.filter_outgoing_message("srv", "#chan", "hi") == {"message": "HI"}
+    assert "Plugin error in filter_outgoing_message: nope" in capsys.readouterr().out
+
+
+def test_plugin_wrappers_are_dispatched_by_pluggy(tmp_path):
+    _write_plugin(
+        tmp_path / "wrapped.py",
+        "\n".join([
+            "from access_irc.plugin_specs import hookimpl",
+            "",
+            "calls = []",
+            "",
+            "@hookimpl(wrapper=True)",
+            "def on_join(ctx, server, channel, nick):",
+            "    calls.append('before')",
+            "    result = yield",
+            "    calls.append('after')",
+            "    return result",
+            "",
+            "@hookimpl",
+            "def on_part(ctx, server, channel, nick, reason):",
+            "    calls.append('part')",
+        ])
+    )
+    manager = PluginManager()
+    manager.plugins_dir = tmp_path
+    manager.discover_and_load_plugins()
+    assert "on_join" not in manager._hook_impls
+
+    _write_plugin(
+        tmp_path / "joiner.py",
+        "\n".join([
+            "from access_irc.plugin_specs import hookimpl",
+            "from access_irc_plugin_wrapped import calls",
+            "",
+            "@hookimpl",
+            "def on_join(ctx, server, channel, nick):",
+            "    calls.append('join')",
+        ])
+    )
+    manager.discover_and_load_plugins()
+    assert "on_join" in manager._hook_callers
+
+    manager.call_join("srv", "#chan", "alice")
+    manager.call_part("srv", "#chan", "alice", "bye")
+    calls = manager.loaded_plugins["wrapped"].module.calls
+    assert calls == ["before", "join", "after", "part"]
+
+
+def test_async_loading_finishes_when_scan_fails(tmp_path, monkeypatch):
+    import access_irc.plugin_manager as plugin_module
+
+    scheduled = []
+    monkeypatch.setattr(plugin_module.GLib, "idle_add",
+                        lambda func, *args: scheduled.append((func, args)))
+
+    def broken_scan():
+        raise PermissionError("denied")
+
+    manager = PluginManager()
+    manager.plugins_dir = tmp_path
+    monkeypatch.setattr(manager, "_plugin_sources", broken_scan)
+    results = []
+    manager._import_plugins_in_background(results.append)
+
+    func, args = scheduled[0]
+    func(*args)
+    assert results == [0]
+
+
+def test_auto_connect_does_not_wait_forever_for_plugins(monkeypatch):
+    from unittest.mock import MagicMock
+    import access_irc.__main__ as main_module
+
+    scheduled = []
+    monkeypatch.setattr(main_module.GLib, "idle_add",
+                        lambda func, *args: scheduled.append(func))
+
+    app = object.__new__(main_module.AccessIRCApplication)
+    app.window = MagicMock()
+    app.plugins = MagicMock()
+    app._auto_connect_started = False
+
+    assert app._on_plugin_load_timeout() is False
+    assert scheduled == [app._auto_connect_servers]
+
+    # Plugins that finish loading late still get on_startup, but the
+    # servers are not auto-connected a second time
+    app._on_plugins_loaded(1)
+    app.plugins.call_startup.assert_called_once_with()
+    assert scheduled == [app._auto_connect_servers]
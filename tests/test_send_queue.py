@@ -0,0 +1,106 @@
+from access_irc.batching_send_queue import BatchingSendQueue
+
+
+def test_flush_writes_queued_lines_in_one_batch():
+    batches = []
+    queue = BatchingSendQueue(batches.append)
+
+    queue.extend(["PRIVMSG #a :one", "PRIVMSG #a :two"])
+    queue.schedule_flush()
+
+    assert batches == [["PRIVMSG #a :one", "PRIVMSG #a :two"]]
+    assert len(queue) == 0
+
+
+def test_lines_queued_during_flush_are_drained_by_active_flusher():
+    batches = []
+
+    def write_lines(lines):
+        batches.append(lines)
+        if len(batches) == 1:
+            # Another producer arrives while this batch is being written
+            queue.append("PRIVMSG #a :late")
+            queue.schedule_flush()
+            assert batches == [["PRIVMSG #a :first"]]
+
+    queue = BatchingSendQueue(write_lines)
+    queue.append("PRIVMSG #a :first")
+    queue.schedule_flush()
+
+    assert batches == [["PRIVMSG #a :first"], ["PRIVMSG #a :late"]]
+
+
+def test_failed_write_does_not_block_later_flushes():
+    calls = []
+
+    def write_lines(lines):
+        calls.append(lines)
+        if len(calls) == 1:
+            raise OSError("broken pipe")
+
+    queue = BatchingSendQueue(write_lines)
+    queue.append("PRIVMSG #a :one")
+    try:
+        queue.schedule_flush()
+    except OSError:
+        pass
+
+    queue.append("PRIVMSG #a :two")
+    queue.schedule_flush()
+    assert calls[-1] == ["PRIVMSG #a :two"]
+
+
+def test_priority_lines_are_written_ahead_of_bulk_lines():
+    batches = []
+    queue = BatchingSendQueue(batches.append)
+
+    queue.extend(["PRIVMSG #a :one", "PRIVMSG #a :two"])
+    queue.append("JOIN #b", priority=True)
+    queue.schedule_flush()
+
+    assert batches == [["JOIN #b", "PRIVMSG #a :one", "PRIVMSG #a :two"]]
+
+
+def test_large_backlog_is_written_in_capped_batches():
+    batches = []
+    queue = BatchingSendQueue(batches.append)
+    queue.max_batch_bytes = 100
+
+    queue.extend([f"PRIVMSG #a :{i:02d}" for i in range(40)])
+    queue.schedule_flush()
+
+    assert [line for batch in batches for line in batch] == [
+        f"PRIVMSG #a :{i:02d}" for i in range(40)
+    ]
+    assert all(sum(len(line) + 2 for line in batch) <= 100 for batch in batches)
+    assert len(queue) == 0
+
+
+def test_concurrent_sender_waits_for_active_flush_and_sees_failures():
+    import threading
+
+    writing = threading.Event()
+    release = threading.Event()
+    flusher_result = []
+
+    def write_lines(lines):
+        if lines == ["PRIVMSG #a :first"]:
+            writing.set()
+            release.wait(2)
+            return True
+        return False
+
+    queue = BatchingSendQueue(write_lines)
+    queue.append("PRIVMSG #a :first")
+    flusher = threading.Thread(target=lambda: flusher_result.append(queue.schedule_flush()))
+    flusher.start()
+    assert writing.wait(2)
+
+    # Let the active flush continue only once this sender is waiting on it
+    threading.Timer(0.2, release.set).start()
+    queue.append("PRIVMSG #a :second")
+    assert queue.schedule_flush() is False
+    flusher.join(2)
+
+    assert len(queue) == 0
+    assert flusher_result == [False]